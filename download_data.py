@@ -25,24 +25,60 @@ Output:
       <slug>.<ext>
 
 Deps:
-  pip install requests beautifulsoup4
+  pip install requests beautifulsoup4 lxml selectolax
+  optional: pip install requests-cache   (on-disk API cache, <out>/.http_cache.sqlite)
 """
 
 
 
 import argparse
+import copy
 import datetime as dt
+import glob
 import hashlib
 import json
 import os
+import random
 import re
+import shutil
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import quote, unquote, urljoin, urlsplit
+from urllib.parse import quote, unquote, urlsplit
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, Tag
+
+try:
+    # Lexbor-backed parser: much faster than BeautifulSoup for the pure CSS-selection work done here
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # fall back to BeautifulSoup
+    LexborHTMLParser = None
+
+try:
+    # without selectolax, the list page (anchors only) is walked with lxml directly
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
+
+try:
+    # C JSON codec, several times faster than json for API responses and checkpoints
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # optional: on-disk cache for API responses, makes re-runs / incremental crawls cheap
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 # -----------------------------
 # CONFIG (defaults)
@@ -64,13 +100,52 @@ DEFAULT_USER_AGENT = os.getenv(
 
 HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
 HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "20"))
+# keep-alive connections per host (api.php + image CDN); should be >= --workers
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "32"))
+
+# API responses are cached on disk for this long (requires requests-cache; 0 = off)
+HTTP_CACHE_TTL = int(os.getenv("HTTP_CACHE_TTL", str(24 * 3600)))
+HTTP_CACHE_FILE = ".http_cache.sqlite"
+
+# Retry backoff: max(sleep_s, RETRY_MIN_BASE_S) * 2^(attempt-1) * (1 + U(0, RETRY_JITTER)),
+# capped at RETRY_MAX_DELAY_S. The floor keeps --sleep 0 from retrying a 429/5xx immediately;
+# the jitter keeps parallel workers from retrying in lockstep after a 429 burst.
+RETRY_MAX_DELAY_S = float(os.getenv("RETRY_MAX_DELAY_S", "30"))
+RETRY_JITTER = 0.5
+RETRY_MIN_BASE_S = 0.2
+# only these are worth retrying; other 4xx are surfaced immediately
+RETRY_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+# image downloads are streamed to disk in chunks of this size
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# MediaWiki accepts up to 50 titles per action=query request (for non-bot users)
+API_BATCH_TITLES = 50
+
+# Checkpoint-only key: set on the record written right after a page is parsed, dropped
+# once the image is attached (that later record for the same id supersedes it)
+PENDING_IMAGE_KEY = "_pending_image"
+
+# BeautifulSoup tree builder; "lxml" (C) is much faster than the pure-Python "html.parser"
+HTML_PARSER = os.getenv("HTML_PARSER", "lxml")
 
 # Strict link filtering: accept only /wiki/<Title> with no query string and no namespaces (':')
 WIKI_PATH_RE = re.compile(r"^/wiki/([^?#]+)$")
 
 # Slugging for local filenames/ids
+SLUG_QUOTES_RE = re.compile(r"[\"“”]")
+SLUG_WS_RE = re.compile(r"[\s_]+")
+SLUG_NONALNUM_RE = re.compile(r"[^a-z0-9\-]")
+SLUG_DASHES_RE = re.compile(r"-{2,}")
 SLUG_KEEP_RE = re.compile(r"[^a-z0-9\-]+")
 
+# Text cleanup: reference markers like [1]
+CLEAN_REF_RE = re.compile(r"\[[0-9A-Za-z]+\]")
+
 
 @dataclass
 class ImageLicenseInfo:
@@ -114,18 +189,15 @@ def ensure_dir(p: str) -> None:
     os.makedirs(p, exist_ok=True)
 
 
-def sha256_hex(b: bytes) -> str:
-    return hashlib.sha256(b).hexdigest()
-
-
+@lru_cache(maxsize=4096)
 def slugify(title: str) -> str:
     s = (title or "").strip().lower()
     s = s.replace("&", "and")
     s = s.replace("’", "'")
-    s = re.sub(r"[\"“”]", "", s)
-    s = re.sub(r"[\s_]+", "-", s)
-    s = re.sub(r"[^a-z0-9\-]", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
+    s = SLUG_QUOTES_RE.sub("", s)
+    s = SLUG_WS_RE.sub("-", s)
+    s = SLUG_NONALNUM_RE.sub("-", s)
+    s = SLUG_DASHES_RE.sub("-", s).strip("-")
     s = SLUG_KEEP_RE.sub("", s)
     return s or "item"
 
@@ -133,11 +205,71 @@ def slugify(title: str) -> str:
 def clean_text(s: str) -> str:
     if not s:
         return ""
-    s = re.sub(r"\s+", " ", s).strip()
-    s = re.sub(r"\[[0-9A-Za-z]+\]", "", s).strip()  # remove reference markers like [1]
+    s = " ".join(s.split())  # collapse whitespace runs (C-level, cheaper than a regex)
+    s = CLEAN_REF_RE.sub("", s).strip()  # remove reference markers like [1]
     return s
 
 
+def _soup(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+# Thin helpers so the extractors work on either a selectolax tree or a BeautifulSoup tree.
+
+def parse_tree(html: str) -> Any:
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    return _soup(html)
+
+
+def _css(node: Any, selector: str) -> List[Any]:
+    if isinstance(node, Tag):
+        return node.select(selector)
+    return node.css(selector)
+
+
+def _css_first(node: Any, selector: str) -> Any:
+    if isinstance(node, Tag):
+        return node.select_one(selector)
+    return node.css_first(selector)
+
+
+def _text(node: Any) -> str:
+    if isinstance(node, Tag):
+        return clean_text(node.get_text(" ", strip=True))
+    return clean_text(node.text(separator=" ", strip=True))
+
+
+def _attr(node: Any, name: str) -> str:
+    if isinstance(node, Tag):
+        return node.get(name) or ""
+    return node.attributes.get(name) or ""
+
+
+def _descendants(node: Any, tag: str) -> Any:
+    """
+    Lazily yields the descendant elements named tag in document order (same order as a
+    select, but the caller can stop at the first match without collecting the rest).
+    """
+    if isinstance(node, Tag):
+        for el in node.descendants:
+            if isinstance(el, Tag) and el.name == tag:
+                yield el
+    else:
+        # traverse() starts with node itself; compare ids, the wrappers are new objects
+        root_id = node.mem_id
+        for el in node.traverse(include_text=False):
+            if el.tag == tag and el.mem_id != root_id:
+                yield el
+
+
+def _node_key(node: Any) -> int:
+    # identity of the underlying element (selectolax creates a new wrapper per access)
+    if isinstance(node, Tag):
+        return id(node)
+    return node.mem_id
+
+
 def parse_boolish(v: Any) -> Optional[bool]:
     if v is None:
         return None
@@ -152,21 +284,117 @@ def parse_boolish(v: Any) -> Optional[bool]:
     return None
 
 
+def _is_retryable_status(status: int) -> bool:
+    return status == 429 or status >= 500
+
+
+def _retry_after_s(r: requests.Response) -> Optional[float]:
+    """
+    Retry-After header in seconds (delta-seconds or HTTP-date form), None if absent/invalid.
+    """
+    v = (r.headers.get("Retry-After") or "").strip()
+    if not v:
+        return None
+    if v.isdigit():
+        return float(v)
+    try:
+        when = parsedate_to_datetime(v)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=dt.timezone.utc)
+    return max(0.0, (when - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+
+def _retry_delay(attempt: int, base_s: float, r: Optional[requests.Response] = None) -> float:
+    if r is not None and r.status_code in (429, 503):
+        after = _retry_after_s(r)
+        if after is not None:
+            return after
+    delay = max(base_s, RETRY_MIN_BASE_S) * (2 ** (attempt - 1)) * (1 + random.uniform(0, RETRY_JITTER))
+    return min(RETRY_MAX_DELAY_S, delay)
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all worker threads: on average one request per interval_s,
+    no matter how many workers are running.
+    """
+
+    def __init__(self, interval_s: float, burst: int = 1) -> None:
+        self.interval_s = interval_s
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.interval_s <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval_s)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) * self.interval_s
+            time.sleep(wait)
+
+
 class FandomClient:
-    def __init__(self, sleep_s: float = 0.7, max_retries: int = 4) -> None:
+    def __init__(
+        self,
+        sleep_s: float = 0.7,
+        max_retries: int = 4,
+        pool_size: int = HTTP_POOL_SIZE,
+        cache_path: Optional[str] = None,
+        cache_ttl_s: int = HTTP_CACHE_TTL,
+    ) -> None:
         self.sleep_s = sleep_s
         self.max_retries = max_retries
-        self.s = requests.Session()
+        # one bucket for the whole client, so parallel workers obey the aggregate rate
+        self.limiter = RateLimiter(sleep_s)
+        self.cached = bool(cache_path and requests_cache is not None and cache_ttl_s > 0)
+        if self.cached:
+            # Only api.php responses are cached; image bodies live on disk and are
+            # revalidated with ETag / Last-Modified instead (see download()).
+            api = urlsplit(API_URL)
+            self.s = requests_cache.CachedSession(
+                cache_path,
+                backend="sqlite",
+                expire_after=cache_ttl_s,
+                urls_expire_after={api.netloc + api.path: cache_ttl_s, "*": requests_cache.DO_NOT_CACHE},
+                allowable_methods=("GET",),
+            )
+        else:
+            self.s = requests.Session()
+        # Large keep-alive pool so parallel workers reuse TCP/TLS connections instead of
+        # churning them; retries are handled by api_get/download, not urllib3.
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=Retry(total=0))
+        self.s.mount("https://", adapter)
+        self.s.mount("http://", adapter)
         self.s.headers.update(
             {
                 "User-Agent": DEFAULT_USER_AGENT,
                 "Accept": "application/json,text/html;q=0.9,*/*;q=0.8",
+                "Connection": "keep-alive",
             }
         )
 
-    def _sleep(self) -> None:
-        if self.sleep_s > 0:
-            time.sleep(self.sleep_s)
+    def _throttle(self) -> None:
+        self.limiter.acquire()
+
+    def _api_request(self, params: Dict[str, Any]) -> requests.Response:
+        timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+        if self.cached:
+            # cache hits never touch the network, so they don't count against the rate limit
+            r = self.s.get(API_URL, params=params, timeout=timeout, only_if_cached=True)
+            if r.status_code != 504:
+                return r
+        self._throttle()
+        return self.s.get(API_URL, params=params, timeout=timeout)
 
     def api_get(self, params: Dict[str, Any]) -> Dict[str, Any]:
         # Always request JSON
@@ -176,21 +404,19 @@ class FandomClient:
 
         last_err = None
         for attempt in range(1, self.max_retries + 1):
+            r = None
             try:
-                r = self.s.get(API_URL, params=params, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
-                if r.status_code in (429, 503, 502):
-                    # Backoff
-                    wait = min(8.0, self.sleep_s * (2 ** (attempt - 1)) + 0.2)
-                    time.sleep(wait)
-                    continue
-                r.raise_for_status()
-                data = r.json()
-                self._sleep()
-                return data
-            except Exception as e:
+                r = self._api_request(params)
+                if _is_retryable_status(r.status_code):
+                    last_err = f"HTTP {r.status_code}"
+                else:
+                    r.raise_for_status()  # other 4xx: not recoverable, no retry
+                    # parse responses carry the whole page HTML inside the JSON
+                    return orjson.loads(r.content) if orjson is not None else r.json()
+            except RETRY_EXCEPTIONS as e:
                 last_err = e
-                wait = min(8.0, self.sleep_s * (2 ** (attempt - 1)) + 0.2)
-                time.sleep(wait)
+            if attempt < self.max_retries:
+                time.sleep(_retry_delay(attempt, self.sleep_s, r))
 
         raise RuntimeError(f"API request failed after retries: {last_err}")
 
@@ -217,62 +443,95 @@ class FandomClient:
             raise RuntimeError(f"empty HTML for {page_title}")
         return norm_title, html
 
+    def _query_pages(self, titles: List[str], params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Multi-title action=query: up to API_BATCH_TITLES titles per request.
+        Returns {requested_title: page}, resolving the API's "normalized" and "redirects" maps
+        so each page can be looked up by the exact title the caller passed in.
+        """
+        out: Dict[str, Dict[str, Any]] = {}
+        for i in range(0, len(titles), API_BATCH_TITLES):
+            batch = titles[i : i + API_BATCH_TITLES]
+            data = self.api_get(dict(params, action="query", titles="|".join(batch), redirects="1"))
+            query = data.get("query") or {}
+            normalized = {n.get("from"): n.get("to") for n in query.get("normalized") or []}
+            redirects = {r.get("from"): r.get("to") for r in query.get("redirects") or []}
+            by_title = {p.get("title"): p for p in query.get("pages") or [] if p}
+            for t in batch:
+                nt = normalized.get(t, t)
+                nt = redirects.get(nt, nt)
+                page = by_title.get(nt)
+                if page is not None:
+                    out[t] = page
+        return out
+
     def page_meta(self, page_title: str) -> Dict[str, Any]:
         """
         Query: revision ids/timestamp + pageimage (if any)
         """
-        data = self.api_get(
+        return self.page_meta_many([page_title]).get(page_title) or {}
+
+    def page_meta_many(self, page_titles: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Batched page_meta: one API round-trip per API_BATCH_TITLES titles.
+        Returns {requested_title: meta}; titles the API did not return are absent.
+        """
+        pages = self._query_pages(
+            page_titles,
             {
-                "action": "query",
-                "titles": page_title,
                 "prop": "revisions|pageimages",
                 "rvprop": "ids|timestamp",
                 "pithumbsize": 1200,
-                "pilimit": 1,
-                "redirects": "1",
-            }
+                # pilimit caps pageimages for the whole request, not per title
+                "pilimit": API_BATCH_TITLES,
+            },
         )
-        pages = ((data.get("query") or {}).get("pages")) or []
-        if not pages:
-            return {}
-        page = pages[0] or {}
-        rev = None
-        revs = page.get("revisions") or []
-        if revs:
-            rev = revs[0]
-        thumb = page.get("thumbnail") or {}
-        original = page.get("original") or {}
-        return {
-            "pageid": page.get("pageid"),
-            "title": page.get("title") or page_title,
-            "revision_id": (rev or {}).get("revid"),
-            "revision_timestamp": (rev or {}).get("timestamp"),
-            "pageimage": page.get("pageimage"),
-            "thumbnail_url": thumb.get("source"),
-            "original_image_url": original.get("source"),
-        }
+        out: Dict[str, Dict[str, Any]] = {}
+        for page_title, page in pages.items():
+            rev = None
+            revs = page.get("revisions") or []
+            if revs:
+                rev = revs[0]
+            thumb = page.get("thumbnail") or {}
+            original = page.get("original") or {}
+            out[page_title] = {
+                "pageid": page.get("pageid"),
+                "title": page.get("title") or page_title,
+                "revision_id": (rev or {}).get("revid"),
+                "revision_timestamp": (rev or {}).get("timestamp"),
+                "pageimage": page.get("pageimage"),
+                "thumbnail_url": thumb.get("source"),
+                "original_image_url": original.get("source"),
+            }
+        return out
 
     def image_info(self, file_title: str) -> ImageLicenseInfo:
         """
         Fetch imageinfo (url + extmetadata when available).
         file_title must be like "File:XYZ.png"
         """
-        data = self.api_get(
+        return self.image_info_many([file_title])[file_title]
+
+    def image_info_many(self, file_titles: List[str]) -> Dict[str, ImageLicenseInfo]:
+        """
+        Batched image_info: one API round-trip per API_BATCH_TITLES files.
+        Returns an ImageLicenseInfo for every requested title (empty if unknown).
+        """
+        pages = self._query_pages(
+            file_titles,
             {
-                "action": "query",
-                "titles": file_title,
                 "prop": "imageinfo",
                 "iiprop": "url|size|mime|extmetadata",
                 "iilimit": 1,
-                "redirects": "1",
-            }
+            },
         )
+        return {t: self._image_info_from_page(t, pages.get(t)) for t in file_titles}
 
-        pages = ((data.get("query") or {}).get("pages")) or []
-        if not pages:
+    @staticmethod
+    def _image_info_from_page(file_title: str, page: Optional[Dict[str, Any]]) -> ImageLicenseInfo:
+        if not page:
             return ImageLicenseInfo(file_title=file_title, extmetadata={})
 
-        page = pages[0] or {}
         ii = (page.get("imageinfo") or [])
         if not ii:
             return ImageLicenseInfo(file_title=file_title, extmetadata={})
@@ -312,27 +571,71 @@ class FandomClient:
             attribution=clean_text(str(attribution)) if attribution else None,
         )
 
-    def download(self, url: str) -> Tuple[bytes, str]:
+    def head(self, url: str) -> Optional[requests.Response]:
         """
-        Returns (content, content_type)
+        Single HEAD request (no retries) as a cheap precheck before a download.
+        Returns None on any network error or non-2xx status.
         """
+        try:
+            self._throttle()
+            r = self.s.head(url, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT), allow_redirects=True)
+        except RETRY_EXCEPTIONS:
+            return None
+        return r if r.ok else None
+
+    def download(
+        self,
+        url: str,
+        sink_path: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Tuple[Optional[str], str, Dict[str, Optional[str]]]:
+        """
+        Streams the body to sink_path in DOWNLOAD_CHUNK_BYTES chunks, hashing on the fly
+        (no full copy in memory, no second pass over the bytes).
+        Returns (sha256, content_type, validators).
+        With etag/last_modified from an earlier download this is a conditional GET; on
+        304 Not Modified sha256 is None, sink_path is not written and the local copy is still current.
+        validators = {"etag": ..., "last_modified": ...} for the next conditional GET.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
         last_err = None
         for attempt in range(1, self.max_retries + 1):
             try:
-                r = self.s.get(url, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT), stream=True)
-                if r.status_code in (429, 503, 502):
-                    wait = min(8.0, self.sleep_s * (2 ** (attempt - 1)) + 0.2)
-                    time.sleep(wait)
+                self._throttle()
+                r = self.s.get(url, headers=headers, timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT), stream=True)
+                if _is_retryable_status(r.status_code):
+                    last_err = f"HTTP {r.status_code}"
+                    r.close()
+                    if attempt < self.max_retries:
+                        time.sleep(_retry_delay(attempt, self.sleep_s, r))
                     continue
-                r.raise_for_status()
                 ct = (r.headers.get("Content-Type") or "").split(";")[0].strip().lower()
-                content = r.content
-                self._sleep()
-                return content, ct
-            except Exception as e:
+                validators = {
+                    "etag": r.headers.get("ETag") or etag,
+                    "last_modified": r.headers.get("Last-Modified") or last_modified,
+                }
+                with r:
+                    if r.status_code == 304 and headers:
+                        return None, ct, validators
+                    r.raise_for_status()
+                    # SHA-256 stays: OpenSSL's SHA-NI path outruns BLAKE2b on current x86, and
+                    # hashing is already fused into the single streaming pass
+                    h = hashlib.sha256()
+                    with open(sink_path, "wb") as f:
+                        for chunk in r.iter_content(DOWNLOAD_CHUNK_BYTES):
+                            f.write(chunk)
+                            h.update(chunk)
+                return h.hexdigest(), ct, validators
+            except RETRY_EXCEPTIONS as e:
                 last_err = e
-                wait = min(8.0, self.sleep_s * (2 ** (attempt - 1)) + 0.2)
-                time.sleep(wait)
+                if attempt < self.max_retries:
+                    time.sleep(_retry_delay(attempt, self.sleep_s))
         raise RuntimeError(f"download failed: {url} ({last_err})")
 
 
@@ -355,32 +658,49 @@ def infer_ext(url: str, content_type: str) -> str:
     return "bin"
 
 
+def _list_page_anchors(html: str) -> Any:
+    """
+    Yields (href, anchor) for every <a href> in the page content. Uses selectolax, else
+    lxml.html (no BeautifulSoup tree for a page that only needs its links), else bs4.
+    """
+    if LexborHTMLParser is None and lxml_html is not None:
+        doc = lxml_html.document_fromstring(html)
+        # Fandom parse HTML typically includes mw-parser-output
+        roots = doc.xpath('//div[contains(concat(" ", normalize-space(@class), " "), " mw-parser-output ")]')
+        for a in (roots[0] if roots else doc).iter("a"):
+            href = a.get("href")
+            if href:
+                yield href, a
+        return
+
+    tree = parse_tree(html)
+    root = _css_first(tree, "div.mw-parser-output") or tree
+    for a in _css(root, "a[href]"):
+        yield _attr(a, "href"), a
+
+
+def _anchor_text(a: Any) -> str:
+    if lxml_html is not None and isinstance(a, lxml_html.HtmlElement):
+        return clean_text(a.text_content())
+    return _text(a)
+
+
 def extract_character_links_from_list_html(html: str) -> List[Tuple[str, str]]:
     """
     Returns list of (link_text, absolute_url) from the List_of_characters page.
     Strict filtering: /wiki/<Title> only, no query/fragment, no namespaces.
     """
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Fandom parse HTML typically includes mw-parser-output
-    root = soup.select_one("div.mw-parser-output") or soup
-
     links: List[Tuple[str, str]] = []
     seen = set()
 
-    for a in root.select("a[href]"):
-        href = a.get("href") or ""
-        text = clean_text(a.get_text(" ", strip=True))
-        if not text:
+    for href, a in _list_page_anchors(html):
+        # Absolute wiki links sometimes appear; normalize to the path. Plain string checks
+        # instead of urlsplit/urljoin: this runs for every anchor on the list page.
+        if href.startswith(WIKI_BASE + "/wiki/"):
+            href = href[len(WIKI_BASE):]
+        elif not href.startswith("/wiki/"):
             continue
-
-        # Absolute wiki links sometimes appear; normalize
-        if href.startswith("http://") or href.startswith("https://"):
-            if not href.startswith(WIKI_BASE + "/wiki/"):
-                continue
-            href_path = urlsplit(href).path
-        else:
-            href_path = urlsplit(href).path
+        href_path = href.partition("#")[0].partition("?")[0]
 
         m = WIKI_PATH_RE.match(href_path)
         if not m:
@@ -394,7 +714,11 @@ def extract_character_links_from_list_html(html: str) -> List[Tuple[str, str]]:
         if title_part.replace(" ", "_") == LIST_PAGE_TITLE:
             continue
 
-        abs_url = urljoin(WIKI_BASE, href_path)
+        text = _anchor_text(a)
+        if not text:
+            continue
+
+        abs_url = WIKI_BASE + href_path
 
         key = abs_url.lower()
         if key in seen:
@@ -405,6 +729,7 @@ def extract_character_links_from_list_html(html: str) -> List[Tuple[str, str]]:
     return links
 
 
+@lru_cache(maxsize=4096)
 def title_from_wiki_url(url: str) -> Optional[str]:
     """
     https://pawpatrol.fandom.com/wiki/Chase -> "Chase"
@@ -422,9 +747,10 @@ def title_from_wiki_url(url: str) -> Optional[str]:
         return None
 
 
-def parse_portable_infobox(html: str) -> Dict[str, Any]:
+def parse_portable_infobox(tree: Any) -> Dict[str, Any]:
     """
     Extracts a "steckbrief" structure from <aside class="portable-infobox"> if present.
+    tree is the parsed page (see parse_tree), shared with extract_lead_summary.
     Returns:
       {
         "title": "...",
@@ -433,62 +759,69 @@ def parse_portable_infobox(html: str) -> Dict[str, Any]:
         "groups": [ {"group": "...", "fields": [..]} ]
       }
     """
-    soup = BeautifulSoup(html, "html.parser")
-    infobox = soup.select_one("aside.portable-infobox")
-    if not infobox:
+    infobox = _css_first(tree, "aside.portable-infobox")
+    if infobox is None:
         return {"title": None, "image": None, "fields": [], "groups": []}
 
     # Title inside infobox (if any)
     ib_title = None
-    title_el = infobox.select_one(".pi-title")
-    if title_el:
-        ib_title = clean_text(title_el.get_text(" ", strip=True))
+    title_el = _css_first(infobox, ".pi-title")
+    if title_el is not None:
+        ib_title = _text(title_el)
 
     # Image: prefer file page link if present
     img_url = None
     file_href = None
 
     # common patterns: figure.pi-image or a.image inside
-    fig = infobox.select_one("figure.pi-item.pi-image") or infobox.select_one("figure.pi-item")
-    if fig:
-        a_img = fig.select_one("a[href]")
-        if a_img:
-            href = a_img.get("href") or ""
+    fig = _css_first(infobox, "figure.pi-item.pi-image") or _css_first(infobox, "figure.pi-item")
+    if fig is not None:
+        a_img = _css_first(fig, "a[href]")
+        if a_img is not None:
+            href = _attr(a_img, "href")
             if href.startswith("/wiki/File:") or "/wiki/File:" in href:
                 file_href = href if href.startswith("/wiki/") else urlsplit(href).path
-        img = fig.select_one("img")
-        if img:
-            img_url = img.get("data-src") or img.get("src")
-
-    # Fields without groups
+        img = _css_first(fig, "img")
+        if img is not None:
+            img_url = _attr(img, "data-src") or _attr(img, "src") or None
+
+    # Groups first (cheap: only their headers), keyed by element identity
+    group_entries: Dict[int, Dict[str, Any]] = {}
+    for grp in _css(infobox, "section.pi-item.pi-group"):
+        header = _css_first(grp, ".pi-header")
+        group_entries[_node_key(grp)] = {"group": _text(header) if header is not None else "", "fields": []}
+
+    # One walk over all data items: every item is a top-level field, and grouped items are
+    # also attached to their enclosing group (found via the ancestor chain).
+    infobox_key = _node_key(infobox)
     fields: List[Dict[str, str]] = []
-    for item in infobox.select(".pi-item.pi-data"):
-        label_el = item.select_one(".pi-data-label")
-        value_el = item.select_one(".pi-data-value")
-        if not label_el or not value_el:
+    for item in _css(infobox, ".pi-item.pi-data"):
+        label_el = _css_first(item, ".pi-data-label")
+        value_el = _css_first(item, ".pi-data-value")
+        if label_el is None or value_el is None:
             continue
-        label = clean_text(label_el.get_text(" ", strip=True))
-        value = clean_text(value_el.get_text(" ", strip=True))
-        if label and value:
-            fields.append({"label": label, "value": value})
-
-    # Grouped fields
-    groups: List[Dict[str, Any]] = []
-    for grp in infobox.select("section.pi-item.pi-group"):
-        header = grp.select_one(".pi-header")
-        gname = clean_text(header.get_text(" ", strip=True)) if header else ""
-        gfields: List[Dict[str, str]] = []
-        for item in grp.select(".pi-item.pi-data"):
-            label_el = item.select_one(".pi-data-label")
-            value_el = item.select_one(".pi-data-value")
-            if not label_el or not value_el:
-                continue
-            label = clean_text(label_el.get_text(" ", strip=True))
-            value = clean_text(value_el.get_text(" ", strip=True))
-            if label and value:
-                gfields.append({"label": label, "value": value})
-        if gname or gfields:
-            groups.append({"group": gname or None, "fields": gfields})
+        label = _text(label_el)
+        value = _text(value_el)
+        if not (label and value):
+            continue
+        fields.append({"label": label, "value": value})
+
+        node = item.parent
+        while node is not None:
+            key = _node_key(node)
+            if key == infobox_key:
+                break
+            entry = group_entries.get(key)
+            if entry is not None:
+                entry["fields"].append({"label": label, "value": value})
+                break
+            node = node.parent
+
+    groups: List[Dict[str, Any]] = [
+        {"group": g["group"] or None, "fields": g["fields"]}
+        for g in group_entries.values()
+        if g["group"] or g["fields"]
+    ]
 
     return {
         "title": ib_title,
@@ -498,15 +831,9 @@ def parse_portable_infobox(html: str) -> Dict[str, Any]:
     }
 
 
-def extract_lead_summary(html: str, max_chars: int = 420) -> Optional[str]:
-    """
-    Best-effort first paragraph summary (kept short for project cards/modals).
-    """
-    soup = BeautifulSoup(html, "html.parser")
-    root = soup.select_one("div.mw-parser-output") or soup
-
-    for p in root.select("p"):
-        txt = clean_text(p.get_text(" ", strip=True))
+def _first_lead_paragraph(paragraphs: Any, max_chars: int) -> Optional[str]:
+    for p in paragraphs:
+        txt = _text(p)
         if not txt:
             continue
         # skip typical non-content boilerplate if present
@@ -520,6 +847,20 @@ def extract_lead_summary(html: str, max_chars: int = 420) -> Optional[str]:
     return None
 
 
+def extract_lead_summary(tree: Any, max_chars: int = 420) -> Optional[str]:
+    """
+    Best-effort first paragraph summary (kept short for project cards/modals).
+    """
+    root = _css_first(tree, "div.mw-parser-output")
+    if root is None:
+        return _first_lead_paragraph(_css(tree, "p"), max_chars)
+
+    # first qualifying <p> in document order (nested ones included), found by a lazy walk
+    # that stops there instead of selecting every paragraph of the page
+    return _first_lead_paragraph(_descendants(root, "p"), max_chars)
+
+
+@lru_cache(maxsize=4096)
 def file_title_from_file_href(file_href: str) -> Optional[str]:
     if not file_href:
         return None
@@ -564,37 +905,387 @@ def load_existing(out_json_path: str) -> Dict[str, Any]:
 
 def save_json(path: str, data: Dict[str, Any]) -> None:
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     os.replace(tmp, path)
 
 
+def load_jsonl(path: str) -> List[Dict[str, Any]]:
+    """
+    Read checkpoint records (one JSON object per line). A torn last line from an
+    interrupted run is skipped.
+    """
+    if not os.path.exists(path):
+        return []
+    out = []
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = orjson.loads(line) if orjson is not None else json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(obj, dict):
+                out.append(obj)
+    return out
+
+
+def append_jsonl(f: Any, obj: Dict[str, Any]) -> None:
+    if orjson is not None:
+        f.write(orjson.dumps(obj) + b"\n")
+    else:
+        f.write(json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n")
+    f.flush()
+
+
+def crawl_character(
+    client: FandomClient,
+    page_title: str,
+    link_text: str,
+    meta_batch: "Future[Dict[str, Dict[str, Any]]]",
+    label: str,
+    retrieved_at: str,
+    lead_max: int,
+) -> Tuple[Dict[str, Any], Optional[str], Optional[str]]:
+    """
+    Crawl one character page (infobox, summary). Runs inside a worker thread.
+    meta_batch is the (possibly still running) batched page_meta_many lookup that covers
+    page_title: the parse request goes out first, so both overlap.
+    Returns (char_obj, file_title, thumb_url); the image is attached afterwards by
+    fetch_image, so that the imageinfo lookups can be batched across pages.
+    """
+    _, page_html = client.parse_html(page_title)
+    meta = meta_batch.result().get(page_title) or {}
+
+    # We'll use the normalized page title from parse/meta for stable naming
+    norm_title = meta.get("title") or page_title.replace("_", " ")
+    char_id = slugify(norm_title)
+
+    print(f"[CRAWL] {label} {norm_title}")
+
+    # parse once, shared by both extractors
+    page_tree = parse_tree(page_html)
+    infobox = parse_portable_infobox(page_tree)
+    summary = extract_lead_summary(page_tree, max_chars=lead_max)
+
+    page_url = f"{WIKI_BASE}/wiki/{quote(norm_title.replace(' ', '_'))}"
+
+    # --- image handling ---
+    image_block = infobox.get("image") or {}
+    file_title = None
+
+    # Prefer file_href from infobox
+    if image_block.get("file_href"):
+        file_title = file_title_from_file_href(image_block.get("file_href"))
+
+    # Fallback: use pageimage from meta
+    if not file_title and meta.get("pageimage"):
+        # meta.pageimage is filename without "File:" in many MW setups
+        file_title = f"File:{meta['pageimage']}"
+
+    # last-resort: use infobox img_url (likely a thumb)
+    thumb_url = None if file_title else image_block.get("img_url")
+
+    # flat profile dict for easy UI rendering
+    # ungrouped fields take precedence; within groups the first occurrence of a label wins
+    flat_profile: Dict[str, str] = {
+        kv["label"]: kv["value"] for kv in infobox.get("fields") or [] if kv.get("label") and kv.get("value")
+    }
+    for kv in chain.from_iterable(grp.get("fields") or [] for grp in infobox.get("groups") or []):
+        if kv.get("label") and kv.get("value"):
+            flat_profile.setdefault(kv["label"], kv["value"])
+
+    # small "tags" for filtering later (best-effort from common infobox keys)
+    tag_keys = ("Species", "Breed", "Team", "Affiliation", "Occupation", "Status")
+    tags = []
+    for k in tag_keys:
+        v = flat_profile.get(k)
+        if v:
+            tags.append(f"{k}: {v}")
+    tags = tags[:8]
+
+    char_obj = {
+        "id": char_id,
+        "name": norm_title,
+        "link_text_from_list": link_text,
+        "tags": tags,
+        "source": {
+            "page_title": norm_title,
+            "page_url": page_url,
+            "list_url": LIST_PAGE_URL,
+            "text_license_default": DEFAULT_TEXT_LICENSE,
+            "text_license_url": COPYRIGHTS_URL,
+            "retrieved_at": retrieved_at,
+            "revision_id": meta.get("revision_id"),
+            "revision_timestamp": meta.get("revision_timestamp"),
+            "attribution": build_attribution_text(
+                page_title=norm_title,
+                page_url=page_url,
+                retrieved_at=retrieved_at,
+                revision_id=meta.get("revision_id"),
+            ),
+        },
+        "summary": summary,
+        "profile": infobox.get("fields") or [],
+        "profile_groups": infobox.get("groups") or [],
+        "profile_flat": flat_profile,
+        "image": {
+            "local_path": None,
+            "sha256": None,
+            "info": None,
+        },
+    }
+
+    return char_obj, file_title, thumb_url
+
+
+class DownloadMemo:
+    """
+    Images stored during this run, by URL, so a URL shared by several characters
+    (placeholder art, shared group pictures) is fetched at most once. Thread-safe: a
+    second worker asking for a URL that is still downloading waits for the first.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._done: Dict[str, Tuple[str, str, Dict[str, Optional[str]]]] = {}
+
+    def url_lock(self, url: str) -> threading.Lock:
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def get(self, url: str) -> Optional[Tuple[str, str, Dict[str, Optional[str]]]]:
+        with self._lock:
+            return self._done.get(url)
+
+    def put(self, url: str, stored: Tuple[str, str, Dict[str, Optional[str]]]) -> None:
+        with self._lock:
+            self._done[url] = stored
+
+
+def _file_sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_BYTES), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def _store_image(
+    client: FandomClient,
+    img_url: str,
+    char_id: str,
+    out_dir: str,
+    previous: Optional[Dict[str, Any]],
+    memo: Optional[DownloadMemo] = None,
+) -> Tuple[str, str, Dict[str, Optional[str]]]:
+    """
+    Store img_url as images/<char_id>.<ext>; see _download_image. With memo, a URL that was
+    already stored for another character in this run is copied locally instead.
+    Returns (local_img_rel, sha256, validators).
+    """
+    if memo is None:
+        return _download_image(client, img_url, char_id, out_dir, previous)
+
+    with memo.url_lock(img_url):
+        stored = memo.get(img_url)
+        if stored is None:
+            stored = _download_image(client, img_url, char_id, out_dir, previous)
+            memo.put(img_url, stored)
+            return stored
+
+    # own file per character: a later crawl may update one of them independently
+    src_rel, digest, validators = stored
+    local_img_rel = f"images/{char_id}{os.path.splitext(src_rel)[1]}"
+    if local_img_rel != src_rel:
+        shutil.copyfile(os.path.join(out_dir, src_rel), os.path.join(out_dir, local_img_rel))
+    return local_img_rel, digest, dict(validators)
+
+
+def _download_image(
+    client: FandomClient,
+    img_url: str,
+    char_id: str,
+    out_dir: str,
+    previous: Optional[Dict[str, Any]],
+) -> Tuple[str, str, Dict[str, Optional[str]]]:
+    """
+    Download img_url to images/<char_id>.<ext>.
+    previous is the image block of the same character from the last crawl: if it was
+    downloaded from the same URL and the file is still on disk, a conditional GET lets a
+    304 skip the transfer entirely.
+    Without such validators, a file already on disk whose size matches the HEAD
+    Content-Length is hashed locally instead of downloaded again.
+    Returns (local_img_rel, sha256, validators).
+    """
+    prev = previous or {}
+    reusable = (
+        prev.get("url") == img_url
+        and prev.get("local_path")
+        and prev.get("sha256")
+        and os.path.isfile(os.path.join(out_dir, prev["local_path"]))
+    )
+    # HEAD only pays off if there is a local file it could confirm (e.g. a re-crawl into
+    # an existing output dir without characters.json)
+    pattern = os.path.join(out_dir, "images", glob.escape(char_id) + ".*")
+    if not reusable and any(not p.endswith(".part") for p in glob.glob(pattern)):
+        r = client.head(img_url)
+        size = r.headers.get("Content-Length") if r is not None else None
+        if size and size.isdigit():
+            ct = (r.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+            local_img_rel = f"images/{char_id}.{infer_ext(img_url, ct)}"
+            local_img_abs = os.path.join(out_dir, local_img_rel)
+            if os.path.isfile(local_img_abs) and os.path.getsize(local_img_abs) == int(size):
+                validators = {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+                return local_img_rel, _file_sha256(local_img_abs), validators
+
+    # the extension depends on the response Content-Type: stream to a temp name, then rename
+    part_abs = os.path.join(out_dir, "images", f"{char_id}.part")
+    try:
+        digest, ct, validators = client.download(
+            img_url,
+            part_abs,
+            etag=prev.get("etag") if reusable else None,
+            last_modified=prev.get("last_modified") if reusable else None,
+        )
+    except Exception:
+        if os.path.exists(part_abs):
+            os.remove(part_abs)
+        raise
+    if digest is None:
+        return prev["local_path"], prev["sha256"], validators
+
+    ext = infer_ext(img_url, ct)
+    local_img_rel = f"images/{char_id}.{ext}"
+    os.replace(part_abs, os.path.join(out_dir, local_img_rel))
+    return local_img_rel, digest, validators
+
+
+def fetch_image(
+    client: FandomClient,
+    char_obj: Dict[str, Any],
+    img_info: Optional[ImageLicenseInfo],
+    thumb_url: Optional[str],
+    out_dir: str,
+    retrieved_at: str,
+    previous: Optional[Dict[str, Any]] = None,
+    memo: Optional[DownloadMemo] = None,
+) -> Dict[str, Any]:
+    """
+    Download the character image and fill char_obj["image"]. Runs inside a worker thread.
+    img_info comes from the batched image_info_many lookup (None if the page has no file title).
+    previous is the character's image block from the last crawl (for conditional GETs).
+    memo is shared by all workers of the run (each URL is downloaded once).
+    """
+    char_id = char_obj["id"]
+    local_img_rel = None
+    img_sha256 = None
+    validators: Dict[str, Optional[str]] = {"etag": None, "last_modified": None}
+
+    if img_info:
+        img_url = img_info.original_url
+        if img_url:
+            local_img_rel, img_sha256, validators = _store_image(client, img_url, char_id, out_dir, previous, memo)
+
+            # enrich attribution
+            img_info.attribution = build_image_attribution(img_info, retrieved_at)
+    else:
+        # last-resort: infobox img_url (likely a thumb); still download
+        img_url = thumb_url
+        if img_url:
+            local_img_rel, img_sha256, validators = _store_image(client, img_url, char_id, out_dir, previous, memo)
+
+    char_obj["image"] = {
+        "local_path": local_img_rel,
+        "sha256": img_sha256,
+        "url": img_url if local_img_rel else None,
+        "etag": validators["etag"],
+        "last_modified": validators["last_modified"],
+        "info": img_info.to_dict() if img_info else None,
+    }
+    return char_obj
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--out", default="out_pawpatrol_characters", help="Output directory")
     ap.add_argument("--max", type=int, default=0, help="Limit number of characters (0 = no limit)")
-    ap.add_argument("--sleep", type=float, default=0.7, help="Sleep between requests (seconds)")
+    ap.add_argument("--sleep", type=float, default=0.7, help="Min. interval between requests, shared by all workers (seconds)")
+    ap.add_argument("--workers", type=int, default=8, help="Parallel page crawls")
     ap.add_argument("--resume", action="store_true", help="Resume from existing JSON (skip already crawled)")
     ap.add_argument("--lead-max", type=int, default=420, help="Max chars for lead summary")
+    ap.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=HTTP_CACHE_TTL,
+        help="Cache API responses on disk for N seconds (needs requests-cache; 0 = off)",
+    )
     args = ap.parse_args()
 
     out_dir = args.out
     images_dir = os.path.join(out_dir, "images")
     out_json = os.path.join(out_dir, "characters.json")
+    # append-only checkpoint: one line per finished character, O(1) per record
+    out_jsonl = os.path.join(out_dir, "characters.jsonl")
 
     ensure_dir(out_dir)
     ensure_dir(images_dir)
 
-    client = FandomClient(sleep_s=args.sleep)
+    client = FandomClient(
+        sleep_s=args.sleep,
+        pool_size=max(HTTP_POOL_SIZE, args.workers),
+        cache_path=os.path.join(out_dir, HTTP_CACHE_FILE),
+        cache_ttl_s=args.cache_ttl,
+    )
 
     retrieved_at = utc_now_iso()
 
-    existing = load_existing(out_json) if args.resume else {}
-    existing_ids = set()
-    if existing and isinstance(existing.get("characters"), list):
-        for ch in existing["characters"]:
-            if isinstance(ch, dict) and ch.get("id"):
-                existing_ids.add(ch["id"])
+    # Previous crawl: the consolidated JSON plus checkpoint records of a run that was
+    # interrupted before writing it. Provides image validators even without --resume.
+    try:
+        previous = load_existing(out_json)
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Ignoring unreadable {out_json}: {e}")
+        previous = {}
+    if not isinstance(previous, dict):
+        print(f"[WARN] Ignoring {out_json}: expected a JSON object")
+        previous = {}
+    previous_chars = [ch for ch in previous.get("characters") or [] if isinstance(ch, dict) and ch.get("id")]
+    known_ids = {ch["id"] for ch in previous_chars}
+    checkpointed: Dict[str, Dict[str, Any]] = {}
+    for ch in load_jsonl(out_jsonl):
+        if ch.get("id") and ch["id"] not in known_ids:
+            # later records win: the one with the image replaces the page-only one
+            checkpointed[ch["id"]] = ch
+    # pages crawled by an interrupted run whose image never got attached: --resume sends
+    # them straight to the image phase instead of crawling the page again
+    pending_images: List[Tuple[Dict[str, Any], Optional[str], Optional[str]]] = []
+    for ch in checkpointed.values():
+        pending = ch.pop(PENDING_IMAGE_KEY, None)
+        if isinstance(pending, dict):
+            pending_images.append((ch, pending.get("file_title"), pending.get("thumb_url")))
+            continue
+        known_ids.add(ch["id"])
+        previous_chars.append(ch)
+
+    previous_images: Dict[str, Dict[str, Any]] = {}
+    for ch in previous_chars:
+        if isinstance(ch.get("image"), dict):
+            previous_images[ch["id"]] = ch["image"]
+
+    existing = previous if args.resume else {}
+    existing_ids = known_ids if args.resume else set()
+    if args.resume:
+        existing_ids = existing_ids | {ch["id"] for ch, _, _ in pending_images}
 
     # 1) Parse list page
     list_norm_title, list_html = client.parse_html(LIST_PAGE_TITLE)
@@ -604,7 +1295,7 @@ def main() -> int:
     if args.max and args.max > 0:
         links = links[: args.max]
 
-    # 2) Crawl each character
+    # Dataset skeleton (or the resumed one)
     dataset = existing if (args.resume and existing) else {
         "meta": {
             "dataset": "pawpatrol-characters",
@@ -627,7 +1318,10 @@ def main() -> int:
 
     # If resuming, refresh meta timestamp
     dataset["meta"]["retrieved_at"] = retrieved_at
+    if args.resume:
+        dataset["characters"] = previous_chars
 
+    tasks: List[Tuple[int, str, str, str]] = []
     seen_titles = set()
     for idx, (link_text, abs_url) in enumerate(links, start=1):
         page_title = title_from_wiki_url(abs_url) or link_text
@@ -635,132 +1329,130 @@ def main() -> int:
         if page_title.lower() in seen_titles:
             continue
         seen_titles.add(page_title.lower())
-
-        # We'll use the normalized page title from parse/meta for stable naming
-        try:
-            meta = client.page_meta(page_title)
-            norm_title = meta.get("title") or page_title.replace("_", " ")
-            char_id = slugify(norm_title)
-
-            if args.resume and char_id in existing_ids:
-                print(f"[SKIP] {idx}/{len(links)} {norm_title} (already in JSON)")
+        tasks.append((idx, link_text, abs_url, page_title))
+
+    # 2) + 3) Page meta (batched, API_BATCH_TITLES per request) and the character pages.
+    # Pages are independent and network-bound: crawl them in parallel; the client's shared
+    # rate limiter keeps the aggregate request rate in check. Meta batches are submitted
+    # first, so each page's parse request overlaps with its meta lookup instead of waiting
+    # for all of them. Results are collected on the main thread only, so no lock is needed
+    # around dataset.
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool, open(
+        out_jsonl, "ab" if args.resume else "wb"
+    ) as checkpoint:
+        if checkpoint.tell() > 0:
+            # terminate a torn last line so the next record starts on its own line
+            with open(out_jsonl, "rb") as prev:
+                prev.seek(-1, os.SEEK_END)
+                if prev.read(1) != b"\n":
+                    checkpoint.write(b"\n")
+
+        meta_batches: Dict[str, Future] = {}
+        all_titles = [t[3] for t in tasks]
+        for i in range(0, len(all_titles), API_BATCH_TITLES):
+            batch = all_titles[i : i + API_BATCH_TITLES]
+            fut = pool.submit(client.page_meta_many, batch)
+            meta_batches.update(dict.fromkeys(batch, fut))
+
+        pending = []
+        skipped_idx: Dict[str, int] = {}
+        for idx, link_text, abs_url, page_title in tasks:
+            meta_batch = meta_batches[page_title]
+            if args.resume:
+                # the skip decision needs the normalized title, so wait for this batch
+                if meta_batch.exception() is not None:
+                    print(f"[WARN] Page meta failed for {page_title}: {meta_batch.exception()}")
+                    continue
+                meta = meta_batch.result().get(page_title) or {}
+                norm_title = meta.get("title") or page_title.replace("_", " ")
+                if slugify(norm_title) in existing_ids:
+                    skipped_idx[slugify(norm_title)] = idx
+                    print(f"[SKIP] {idx}/{len(links)} {norm_title} (already crawled)")
+                    continue
+            pending.append((idx, link_text, abs_url, page_title, meta_batch))
+
+        futures = {
+            pool.submit(
+                crawl_character,
+                client,
+                page_title,
+                link_text,
+                meta_batch,
+                f"{idx}/{len(links)}",
+                retrieved_at,
+                args.lead_max,
+            ): (idx, abs_url)
+            for idx, link_text, abs_url, page_title, meta_batch in pending
+        }
+        # (list index, page result): pages finish in any order, the dataset keeps list order
+        done: List[Tuple[int, Tuple[Dict[str, Any], Optional[str], Optional[str]]]] = []
+        for fut in as_completed(futures):
+            idx, abs_url = futures[fut]
+            try:
+                char_obj, file_title, thumb_url = fut.result()
+            except Exception as e:
+                print(f"[WARN] Failed for {abs_url}: {e}")
+                # keep going
+                continue
+            done.append((idx, (char_obj, file_title, thumb_url)))
+            # checkpoint the page right away; the record written after the image download
+            # supersedes this one
+            append_jsonl(
+                checkpoint,
+                {**char_obj, PENDING_IMAGE_KEY: {"file_title": file_title, "thumb_url": thumb_url}},
+            )
+
+        if args.resume:
+            # resumed pages (page record already checkpointed) take their list position
+            # too; pages no longer on the list go last
+            done.extend((skipped_idx.get(p[0]["id"], len(links) + 1), p) for p in pending_images)
+        crawled = [result for _, result in sorted(done, key=lambda d: d[0])]
+
+        # 4) Image metadata, batched across all crawled pages
+        # sorted: batches (and their cache keys) don't depend on completion order
+        file_titles = sorted({ft for _, ft, _ in crawled if ft})
+        img_infos: Dict[str, ImageLicenseInfo] = {}
+        for i in range(0, len(file_titles), API_BATCH_TITLES):
+            batch = file_titles[i : i + API_BATCH_TITLES]
+            try:
+                img_infos.update(client.image_info_many(batch))
+            except Exception as e:
+                print(f"[WARN] Image info failed for {len(batch)} files: {e}")
+
+        # 5) Image downloads
+        memo = DownloadMemo()
+        futures = {
+            pool.submit(
+                fetch_image,
+                client,
+                char_obj,
+                # own copy per character: fetch_image enriches the attribution in place
+                copy.copy(img_infos[file_title]) if file_title in img_infos else None,
+                thumb_url,
+                out_dir,
+                retrieved_at,
+                previous_images.get(char_obj["id"]),
+                memo,
+            ): (pos, char_obj)
+            for pos, (char_obj, file_title, thumb_url) in enumerate(crawled)
+            if not file_title or file_title in img_infos
+        }
+        finished: List[Tuple[int, Dict[str, Any]]] = []
+        for fut in as_completed(futures):
+            pos, char_obj = futures[fut]
+            try:
+                char_obj = fut.result()
+            except Exception as e:
+                print(f"[WARN] Image failed for {char_obj['source']['page_url']}: {e}")
+                # keep going
                 continue
 
-            print(f"[CRAWL] {idx}/{len(links)} {norm_title}")
-
-            _, page_html = client.parse_html(page_title)
-            infobox = parse_portable_infobox(page_html)
-            summary = extract_lead_summary(page_html, max_chars=args.lead_max)
-
-            page_url = f"{WIKI_BASE}/wiki/{quote(norm_title.replace(' ', '_'))}"
-
-            # --- image handling ---
-            image_block = infobox.get("image") or {}
-            file_title = None
-
-            # Prefer file_href from infobox
-            if image_block.get("file_href"):
-                file_title = file_title_from_file_href(image_block.get("file_href"))
-
-            # Fallback: use pageimage from meta
-            if not file_title and meta.get("pageimage"):
-                # meta.pageimage is filename without "File:" in many MW setups
-                file_title = f"File:{meta['pageimage']}"
-
-            img_info = None
-            local_img_rel = None
-            local_img_abs = None
-            img_sha256 = None
-
-            if file_title:
-                img_info = client.image_info(file_title)
-                img_url = img_info.original_url
-                if img_url:
-                    content, ct = client.download(img_url)
-                    ext = infer_ext(img_url, ct)
-                    local_img_rel = f"images/{char_id}.{ext}"
-                    local_img_abs = os.path.join(out_dir, local_img_rel)
-
-                    with open(local_img_abs, "wb") as f:
-                        f.write(content)
-                    img_sha256 = sha256_hex(content)
-
-                    # enrich attribution
-                    img_info.attribution = build_image_attribution(img_info, retrieved_at)
-            else:
-                # last-resort: use infobox img_url (likely a thumb); still download
-                img_url = image_block.get("img_url")
-                if img_url:
-                    content, ct = client.download(img_url)
-                    ext = infer_ext(img_url, ct)
-                    local_img_rel = f"images/{char_id}.{ext}"
-                    local_img_abs = os.path.join(out_dir, local_img_rel)
-                    with open(local_img_abs, "wb") as f:
-                        f.write(content)
-                    img_sha256 = sha256_hex(content)
-
-            # flat profile dict for easy UI rendering
-            flat_profile: Dict[str, str] = {}
-            for kv in infobox.get("fields") or []:
-                if kv.get("label") and kv.get("value"):
-                    flat_profile[kv["label"]] = kv["value"]
-            for grp in infobox.get("groups") or []:
-                for kv in grp.get("fields") or []:
-                    if kv.get("label") and kv.get("value") and kv["label"] not in flat_profile:
-                        flat_profile[kv["label"]] = kv["value"]
-
-            # small "tags" for filtering later (best-effort from common infobox keys)
-            tag_keys = ("Species", "Breed", "Team", "Affiliation", "Occupation", "Status")
-            tags = []
-            for k in tag_keys:
-                v = flat_profile.get(k)
-                if v:
-                    tags.append(f"{k}: {v}")
-            tags = tags[:8]
-
-            char_obj = {
-                "id": char_id,
-                "name": norm_title,
-                "link_text_from_list": link_text,
-                "tags": tags,
-                "source": {
-                    "page_title": norm_title,
-                    "page_url": page_url,
-                    "list_url": LIST_PAGE_URL,
-                    "text_license_default": DEFAULT_TEXT_LICENSE,
-                    "text_license_url": COPYRIGHTS_URL,
-                    "retrieved_at": retrieved_at,
-                    "revision_id": meta.get("revision_id"),
-                    "revision_timestamp": meta.get("revision_timestamp"),
-                    "attribution": build_attribution_text(
-                        page_title=norm_title,
-                        page_url=page_url,
-                        retrieved_at=retrieved_at,
-                        revision_id=meta.get("revision_id"),
-                    ),
-                },
-                "summary": summary,
-                "profile": infobox.get("fields") or [],
-                "profile_groups": infobox.get("groups") or [],
-                "profile_flat": flat_profile,
-                "image": {
-                    "local_path": local_img_rel,
-                    "sha256": img_sha256,
-                    "info": img_info.to_dict() if img_info else None,
-                },
-            }
-
-            dataset["characters"].append(char_obj)
-
-            # checkpoint every 10
-            if len(dataset["characters"]) % 10 == 0:
-                save_json(out_json, dataset)
-
-        except Exception as e:
-            print(f"[WARN] Failed for {abs_url}: {e}")
-            # keep going
+            finished.append((pos, char_obj))
+            append_jsonl(checkpoint, char_obj)
+        # back to crawl (= list) order, so an unchanged wiki yields an unchanged file
+        dataset["characters"].extend(char_obj for _, char_obj in sorted(finished, key=lambda f: f[0]))
 
-    # final save
+    # final save: consolidate into the single JSON file (written once per run)
     save_json(out_json, dataset)
 
     print(f"[DONE] Wrote: {out_json} (characters={len(dataset['characters'])})")
@@ -7,13 +7,27 @@ API:
 - GET /media/<path:relpath>  -> Dient zum Ausliefern von Mediendateien
 """
 
+# Cold start: keep module-level imports to stdlib + Flask (`python -X importtime -c "import main"`).
+# The crawler/translator scripts (requests, bs4, google-cloud-translate) are never imported
+# here; anything heavy that only a single handler needs belongs inside that handler.
+import gzip
+import hashlib
 import json
 import os
 import re
+import sys
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+from types import GeneratorType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-from flask import Flask, Response, jsonify, render_template_string, request, send_file
+from flask import Flask, Response, jsonify, request, send_file
+from markupsafe import Markup
+
+try:
+    # C JSON codec: faster dataset load at cold start and API serialization
+    import orjson
+except ImportError:
+    orjson = None
 
 # ------------------------------------------------------------
 # 0) INPUT-DATEN (NAV / META)
@@ -45,22 +59,36 @@ DEFAULT_DATA_BASE_DIR = "out_pawpatrol_characters"
 
 DATA_JSON_PATH = os.getenv("DATA_JSON_PATH", DEFAULT_DATA_JSON_PATH)
 DATA_BASE_DIR = os.getenv("DATA_BASE_DIR", DEFAULT_DATA_BASE_DIR)
+# Above this size the characters are streamed (ijson) instead of parsed in one go
+JSON_STREAM_MIN_BYTES = int(os.getenv("JSON_STREAM_MIN_BYTES", str(500_000_000)))
+# resolved once; media paths are validated against it when the dataset is loaded
+MEDIA_ROOT = os.path.realpath(DATA_BASE_DIR)
 
 # ------------------------------------------------------------
 # 2) VALIDATION / SECURITY
 # ------------------------------------------------------------
 
 ID_RE = re.compile(r"^[a-z0-9-]{1,80}$")
+# CSS minification (import time only)
+CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};,])\s*")
 # Restrict media to known folder subtree
 MEDIA_ALLOWED_PREFIX = "images/"
 # Cache images publicly for a week by default (Cloud Run CDN / browser)
 MEDIA_MAX_AGE_SECONDS = int(os.getenv("MEDIA_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+# API bodies are constant per deployment; lower this if the dataset is updated in place
+API_MAX_AGE_SECONDS = int(os.getenv("API_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
 
 
 def _is_truthy_profile_flat(v: Any) -> bool:
     return isinstance(v, dict) and any(str(k).strip() and str(val).strip() for k, val in v.items())
 
 
+def _intern(v: Any) -> Any:
+    # profile labels/short values repeat across characters: share one str object each
+    return sys.intern(v) if isinstance(v, str) and len(v) < 64 else v
+
+
 def _safe_realpath(base_dir: str, rel_path: str) -> Optional[str]:
     """
     Prevent path traversal: only allow paths within base_dir.
@@ -89,11 +117,62 @@ def _clean_services(services: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
 # 3) LOAD + CACHE DATASET
 # ------------------------------------------------------------
 
+class CharView(NamedTuple):
+    """
+    One character card as the page template reads it (attribute access, no per-row dict).
+    """
+
+    id: str
+    name: str
+    image_url: Optional[str]
+    profile_items: List[Tuple[str, str]]
+    source_page_url: Optional[str]
+    source_attribution: Optional[str]
+
+
+def _iter_json_items(path: str, prefix: str) -> Any:
+    import ijson  # availability checked by _load_json_file
+
+    with open(path, "rb") as f:
+        yield from ijson.items(f, prefix, use_float=True)
+
+
 def _load_json_file(path: str) -> Dict[str, Any]:
+    """
+    orjson parses the whole file at once: for the real dataset (a few MB) that is both the
+    fastest and the leanest option; streaming parsers are an order of magnitude slower.
+    Only a file beyond JSON_STREAM_MIN_BYTES (and with ijson installed) is streamed: then
+    "characters" is a generator, filtered one by one in load_dataset, so the raw bytes
+    and the full parse tree never have to fit in memory together.
+    """
+    if os.path.getsize(path) > JSON_STREAM_MIN_BYTES:
+        try:
+            # optional, and imported only here: datasets far beyond the current size
+            import ijson
+        except ImportError:
+            pass
+        else:
+            with open(path, "rb") as f:
+                meta = next(ijson.items(f, "meta", use_float=True), {})
+            return {"meta": meta, "characters": _iter_json_items(path, "characters.item")}
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def _json_bytes(obj: Any) -> bytes:
+    # sorted keys, compact separators: same output shape as jsonify
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _json_response(obj: Any, status: int = 200) -> Response:
+    return Response(_json_bytes(obj), status=status, mimetype="application/json")
+
+
 @lru_cache(maxsize=1)
 def load_dataset() -> Dict[str, Any]:
     """
@@ -110,11 +189,14 @@ def load_dataset() -> Dict[str, Any]:
         raise ValueError("Ungültiges JSON-Format: Root muss ein Objekt sein.")
 
     chars = raw.get("characters")
-    if not isinstance(chars, list):
+    if not isinstance(chars, (list, GeneratorType)):
         raise ValueError("Ungültiges JSON-Format: 'characters' muss eine Liste sein.")
 
     filtered = []
     by_id = {}
+    # "images/x.webp" -> validated absolute path, for every referenced image that exists
+    media_index: Dict[str, str] = {}
+    id_match = ID_RE.match  # bound once for the loop
 
     for ch in chars:
         if not isinstance(ch, dict):
@@ -124,7 +206,7 @@ def load_dataset() -> Dict[str, Any]:
         name = ch.get("name")
         profile_flat = ch.get("profile_flat")
 
-        if not isinstance(cid, str) or not ID_RE.match(cid):
+        if not isinstance(cid, str) or not id_match(cid):
             continue
         if not isinstance(name, str) or not name.strip():
             continue
@@ -138,6 +220,13 @@ def load_dataset() -> Dict[str, Any]:
             if isinstance(lp, str) and lp.strip():
                 image_rel = lp.strip()
 
+        image_url = _media_url_for_local_path(image_rel)
+        if image_url:
+            rel = image_url[len("/media/"):]
+            image_abs = _safe_realpath(os.path.join(MEDIA_ROOT, MEDIA_ALLOWED_PREFIX), rel[len(MEDIA_ALLOWED_PREFIX):])
+            if image_abs and os.path.isfile(image_abs):
+                media_index[rel] = image_abs
+
         source = ch.get("source") or {}
         src_url = source.get("page_url") if isinstance(source, dict) else None
         src_attr = source.get("attribution") if isinstance(source, dict) else None
@@ -147,7 +236,8 @@ def load_dataset() -> Dict[str, Any]:
             "id": cid,
             "name": name.strip(),
             "image_local_path": image_rel,  # e.g. images/chase.jpg
-            "profile_flat": dict(profile_flat),
+            "image_url": image_url,  # e.g. /media/images/chase.jpg
+            "profile_flat": {_intern(k): _intern(v) for k, v in profile_flat.items()},
             "source_page_url": src_url if isinstance(src_url, str) else None,
             "source_attribution": src_attr if isinstance(src_attr, str) else None,
         }
@@ -158,8 +248,33 @@ def load_dataset() -> Dict[str, Any]:
     # Sort for stable UI
     filtered.sort(key=lambda x: x["name"].lower())
 
+    # Template-ready rows, built once here instead of on every page render
+    characters_view = []
+    for ch in filtered:
+        # stable, readable key order: sort decorated tuples (plain C tuple compare, no key
+        # callback); the index keeps case-only duplicates in insertion order
+        decorated = [(str(k).lower(), i, str(k), str(v)) for i, (k, v) in enumerate(ch["profile_flat"].items())]
+        decorated.sort()
+        items = [(k, v) for _, _, k, v in decorated]
+        characters_view.append(
+            CharView(
+                id=ch["id"],
+                name=ch["name"],
+                image_url=ch["image_url"],
+                profile_items=items,
+                source_page_url=ch["source_page_url"],
+                source_attribution=ch["source_attribution"],
+            )
+        )
+
     meta = raw.get("meta") if isinstance(raw.get("meta"), dict) else {}
-    return {"meta": meta, "characters": filtered, "by_id": by_id}
+    return {
+        "meta": meta,
+        "characters": filtered,
+        "by_id": by_id,
+        "characters_view": characters_view,
+        "media_index": media_index,
+    }
 
 
 # ------------------------------------------------------------
@@ -168,17 +283,8 @@ def load_dataset() -> Dict[str, Any]:
 
 app = Flask(__name__)
 
-TEMPLATE = r"""
-<!doctype html>
-<html lang="de">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <meta name="theme-color" content="#0b0f19" />
-  <meta name="robots" content="noindex,nofollow"/>
-
-  <title>{{ meta.page_title }}</title>
-
+# Static chunks of the page, kept out of TEMPLATE so Jinja emits them as one value each
+STYLES_HTML = r"""
   <style>
   :root{
     --bg: #0b0f19;
@@ -459,125 +565,9 @@ TEMPLATE = r"""
     overflow:hidden; clip:rect(0,0,0,0); border:0;
   }
   </style>
-</head>
-
-<body>
-  <a class="skip-link" href="#main">Zum Inhalt springen</a>
-
-   <header class="site-header">
-    <div class="container header-inner">
-      <a class="brand" href="{{ landing_url }}" aria-label="Zur Landing Page">
-        <span class="brand-mark" aria-hidden="true"></span>
-        <span class="brand-text">data-tales.dev</span>
-      </a>
-
-      <div class="nav-dropdown" data-dropdown>
-          <button class="btn btn-ghost nav-dropbtn"
-                  type="button"
-                  aria-haspopup="true"
-                  aria-expanded="false"
-                  aria-controls="servicesMenu">
-            Dienste <span class="nav-caret" aria-hidden="true">▾</span>
-          </button>
-
-          <div id="servicesMenu" class="card nav-menu" role="menu" hidden>
-            <a role="menuitem" href="https://flybi-demo.data-tales.dev/">Flybi Dashboard Demo</a>
-            <a role="menuitem" href="https://wms-wfs-sources.data-tales.dev/">WMS/WFS Server Viewer</a>
-            <a role="menuitem" href="https://tree-locator.data-tales.dev/">Tree Locator</a>
-            <a role="menuitem" href="https://plz.data-tales.dev/">PLZ → Koordinaten</a>
-            <a role="menuitem" href="https://paw-wiki.data-tales.dev/">Paw Wiki</a>
-            <a role="menuitem" href="https://paw-quiz.data-tales.dev/">Paw Quiz</a>
-            <a role="menuitem" href="https://wizard-quiz.data-tales.dev/">Wizard Quiz</a>
-            <a role="menuitem" href="https://worm-attack-3000.data-tales.dev/">Wurm Attacke 3000</a>
-          </div>
-      </div>
-
-      <div class="header-actions">
-        <div class="header-note" aria-label="Feedback Kontakt">
-          <span class="header-note__label">Änderung / Kritik:</span>
-          <a class="header-note__mail" href="mailto:info@data-tales.dev">info@data-tales.dev</a>
-        </div>
-
-        
-        <button class="btn btn-ghost" id="themeToggle" type="button" aria-label="Theme umschalten">
-          <span aria-hidden="true" id="themeIcon">☾</span>
-          <span class="sr-only">Theme umschalten</span>
-        </button>
-      </div>
-    </div>
-  </header>
-
-  <main id="main">
-    <section class="section">
-      <div class="container">
-        <p class="kicker">Service</p>
-        <h1>{{ meta.page_h1 }}</h1>
-        <p class="lead">{{ meta.page_subtitle }}</p>
-
-        {% if error %}
-          <div class="card">
-            <div style="font-weight:900; margin-bottom:8px;">Fehler</div>
-            <p class="muted">{{ error }}</p>
-          </div>
-        {% else %}
-          <p class="muted" style="margin-bottom:18px;">
-            Angezeigt: <strong>{{ characters|length }}</strong> Charaktere (nur Einträge mit <code>profile_flat</code>).
-          </p>
-
-          <div class="grid" id="charGrid">
-            {% for ch in characters %}
-              <article class="card char-card" data-id="{{ ch.id }}">
-                <button class="char-toggle" type="button"
-                        aria-expanded="false"
-                        aria-controls="details-{{ ch.id }}"
-                        data-id="{{ ch.id }}">
-                  <div class="char-title">{{ ch.name }}</div>
-
-                  {% if ch.image_url %}
-                    <div class="char-thumb">
-                      <img src="{{ ch.image_url }}" alt="Bild von {{ ch.name }}" loading="lazy" />
-                    </div>
-                  {% else %}
-                    <div class="char-thumb placeholder" aria-label="Kein Bild verfügbar">
-                      Kein Bild
-                    </div>
-                  {% endif %}
-                </button>
-
-                <div class="char-details" id="details-{{ ch.id }}" hidden>
-                  <dl class="kv">
-                    {% for k, v in ch.profile_items %}
-                      <dt>{{ k }}</dt>
-                      <dd>{{ v }}</dd>
-                    {% endfor %}
-                  </dl>
-
-                  <div class="attr">
-                    {% if ch.source_page_url %}
-                      <div><strong>Quelle:</strong> <a href="{{ ch.source_page_url }}" target="_blank" rel="noreferrer">{{ ch.source_page_url }}</a></div>
-                    {% endif %}
-                    {% if ch.source_attribution %}
-                      <div style="margin-top:6px;">{{ ch.source_attribution }}</div>
-                    {% else %}
-                      <div style="margin-top:6px;">Hinweis: Bitte Lizenz/Attribution gemäß CC-BY-SA prüfen und beim Weitergeben nennen.</div>
-                    {% endif %}
-                  </div>
-                </div>
-              </article>
-            {% endfor %}
-          </div>
-        {% endif %}
-      </div>
-    </section>
-  </main>
-
-  <footer class="site-footer">
-    <div class="container footer-inner">
-      <span class="muted">© <span id="year"></span> data-tales.dev</span>
-      <span class="muted">Flask • Cloud Run</span>
-    </div>
-  </footer>
+"""
 
+SCRIPT_HTML = r"""
   <script>
     (function(){
     const dd = document.querySelector('[data-dropdown]');
@@ -735,10 +725,170 @@ TEMPLATE = r"""
     });
   })();
   </script>
+"""
+
+SERVICES_MENU_HTML = r"""
+          <div id="servicesMenu" class="card nav-menu" role="menu" hidden>
+            <a role="menuitem" href="https://flybi-demo.data-tales.dev/">Flybi Dashboard Demo</a>
+            <a role="menuitem" href="https://wms-wfs-sources.data-tales.dev/">WMS/WFS Server Viewer</a>
+            <a role="menuitem" href="https://tree-locator.data-tales.dev/">Tree Locator</a>
+            <a role="menuitem" href="https://plz.data-tales.dev/">PLZ → Koordinaten</a>
+            <a role="menuitem" href="https://paw-wiki.data-tales.dev/">Paw Wiki</a>
+            <a role="menuitem" href="https://paw-quiz.data-tales.dev/">Paw Quiz</a>
+            <a role="menuitem" href="https://wizard-quiz.data-tales.dev/">Wizard Quiz</a>
+            <a role="menuitem" href="https://worm-attack-3000.data-tales.dev/">Wurm Attacke 3000</a>
+          </div>
+"""
+
+TEMPLATE = r"""
+<!doctype html>
+<html lang="de">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <meta name="theme-color" content="#0b0f19" />
+  <meta name="robots" content="noindex,nofollow"/>
+
+  <title>{{ meta.page_title }}</title>
+
+  {{ styles }}
+</head>
+
+<body>
+  <a class="skip-link" href="#main">Zum Inhalt springen</a>
+
+   <header class="site-header">
+    <div class="container header-inner">
+      <a class="brand" href="{{ landing_url }}" aria-label="Zur Landing Page">
+        <span class="brand-mark" aria-hidden="true"></span>
+        <span class="brand-text">data-tales.dev</span>
+      </a>
+
+      <div class="nav-dropdown" data-dropdown>
+          <button class="btn btn-ghost nav-dropbtn"
+                  type="button"
+                  aria-haspopup="true"
+                  aria-expanded="false"
+                  aria-controls="servicesMenu">
+            Dienste <span class="nav-caret" aria-hidden="true">▾</span>
+          </button>
+
+          {{ services_menu }}
+      </div>
+
+      <div class="header-actions">
+        <div class="header-note" aria-label="Feedback Kontakt">
+          <span class="header-note__label">Änderung / Kritik:</span>
+          <a class="header-note__mail" href="mailto:info@data-tales.dev">info@data-tales.dev</a>
+        </div>
+
+        
+        <button class="btn btn-ghost" id="themeToggle" type="button" aria-label="Theme umschalten">
+          <span aria-hidden="true" id="themeIcon">☾</span>
+          <span class="sr-only">Theme umschalten</span>
+        </button>
+      </div>
+    </div>
+  </header>
+
+  <main id="main">
+    <section class="section">
+      <div class="container">
+        <p class="kicker">Service</p>
+        <h1>{{ meta.page_h1 }}</h1>
+        <p class="lead">{{ meta.page_subtitle }}</p>
+
+        {% if error %}
+          <div class="card">
+            <div style="font-weight:900; margin-bottom:8px;">Fehler</div>
+            <p class="muted">{{ error }}</p>
+          </div>
+        {% else %}
+          <p class="muted" style="margin-bottom:18px;">
+            Angezeigt: <strong>{{ characters|length }}</strong> Charaktere (nur Einträge mit <code>profile_flat</code>).
+          </p>
+
+          <div class="grid" id="charGrid">
+            {% for ch in characters %}
+              <article class="card char-card" data-id="{{ ch.id }}">
+                <button class="char-toggle" type="button"
+                        aria-expanded="false"
+                        aria-controls="details-{{ ch.id }}"
+                        data-id="{{ ch.id }}">
+                  <div class="char-title">{{ ch.name }}</div>
+
+                  {% if ch.image_url %}
+                    <div class="char-thumb">
+                      <img src="{{ ch.image_url }}" alt="Bild von {{ ch.name }}" loading="lazy" />
+                    </div>
+                  {% else %}
+                    <div class="char-thumb placeholder" aria-label="Kein Bild verfügbar">
+                      Kein Bild
+                    </div>
+                  {% endif %}
+                </button>
+
+                <div class="char-details" id="details-{{ ch.id }}" hidden>
+                  <dl class="kv">
+                    {% for k, v in ch.profile_items %}
+                      <dt>{{ k }}</dt>
+                      <dd>{{ v }}</dd>
+                    {% endfor %}
+                  </dl>
+
+                  <div class="attr">
+                    {% if ch.source_page_url %}
+                      <div><strong>Quelle:</strong> <a href="{{ ch.source_page_url }}" target="_blank" rel="noreferrer">{{ ch.source_page_url }}</a></div>
+                    {% endif %}
+                    {% if ch.source_attribution %}
+                      <div style="margin-top:6px;">{{ ch.source_attribution }}</div>
+                    {% else %}
+                      <div style="margin-top:6px;">Hinweis: Bitte Lizenz/Attribution gemäß CC-BY-SA prüfen und beim Weitergeben nennen.</div>
+                    {% endif %}
+                  </div>
+                </div>
+              </article>
+            {% endfor %}
+          </div>
+        {% endif %}
+      </div>
+    </section>
+  </main>
+
+  <footer class="site-footer">
+    <div class="container footer-inner">
+      <span class="muted">© <span id="year"></span> data-tales.dev</span>
+      <span class="muted">Flask • Cloud Run</span>
+    </div>
+  </footer>
+
+  {{ script }}
 </body>
 </html>
 """
 
+# Compiled once: render_template_string would lex/parse/compile TEMPLATE on every request
+PAGE_TEMPLATE = app.jinja_env.from_string(TEMPLATE)
+
+
+def _minify_css(css: str) -> str:
+    css = CSS_COMMENT_RE.sub("", css)
+    css = " ".join(css.split())
+    return CSS_PUNCT_SPACE_RE.sub(r"\1", css)
+
+
+def _minify_js(js: str) -> str:
+    # conservative: drop indentation, blank lines and whole-line // comments only
+    # (the script has no template literals, so no string spans a line break)
+    lines = (ln.strip() for ln in js.splitlines())
+    return "\n".join(ln for ln in lines if ln and not ln.startswith("//"))
+
+
+# already-safe markup: inserted verbatim, no escaping pass; minified once at import
+STYLES = Markup(_minify_css(STYLES_HTML.strip()))
+SCRIPT = Markup(_minify_js(SCRIPT_HTML.strip()))
+SERVICES_MENU = Markup(SERVICES_MENU_HTML.strip())
+
 
 def _build_nav() -> Tuple[List[Tuple[str, str]], bool]:
     cleaned = _clean_services(SERVICES)
@@ -747,6 +897,10 @@ def _build_nav() -> Tuple[List[Tuple[str, str]], bool]:
     return cleaned[:6], show_more
 
 
+# SERVICES is static: clean and cut the nav once
+NAV_LINKS, NAV_SHOW_MORE = _build_nav()
+
+
 def _media_url_for_local_path(local_path: Optional[str]) -> Optional[str]:
     if not local_path or not isinstance(local_path, str):
         return None
@@ -759,113 +913,152 @@ def _media_url_for_local_path(local_path: Optional[str]) -> Optional[str]:
 
 
 def _render_page(error: Optional[str] = None) -> str:
-    nav_links, show_more = _build_nav()
-    chars_view = []
-
-    if not error:
-        ds = load_dataset()
-        for ch in ds["characters"]:
-            pf = ch.get("profile_flat") or {}
-            # stable, readable key order
-            items = sorted(((str(k), str(v)) for k, v in pf.items()), key=lambda kv: kv[0].lower())
-            chars_view.append(
-                {
-                    "id": ch["id"],
-                    "name": ch["name"],
-                    "image_url": _media_url_for_local_path(ch.get("image_local_path")),
-                    "profile_items": items,
-                    "source_page_url": ch.get("source_page_url"),
-                    "source_attribution": ch.get("source_attribution"),
-                }
-            )
+    chars_view = [] if error else load_dataset()["characters_view"]
 
-    return render_template_string(
-        TEMPLATE,
+    return PAGE_TEMPLATE.render(
         meta=SERVICE_META,
+        styles=STYLES,
+        services_menu=SERVICES_MENU,
+        script=SCRIPT,
         landing_url=LANDING_URL,
         cookbook_url=COOKBOOK_URL,
-        nav_links=nav_links,
-        show_more=show_more,
+        nav_links=NAV_LINKS,
+        show_more=NAV_SHOW_MORE,
         error=error,
         characters=chars_view,
     )
 
 
+def _cached_body(body: bytes) -> Tuple[bytes, bytes, str]:
+    """
+    (body, gzip-compressed body, etag) for a response that is constant per process:
+    compressed once instead of per request.
+    """
+    return body, gzip.compress(body, 9, mtime=0), hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+DATASET_ERROR_MSG = (
+    "Datenset konnte nicht geladen werden. "
+    "Prüfe, ob 'out_pawpatrol_characters/characters.json' im Service vorhanden ist "
+    "oder setze DATA_JSON_PATH/DATA_BASE_DIR korrekt."
+)
+# the only error the page shows is fixed: render it once, no Jinja on any request path
+ERROR_PAGE_HTML = _render_page(error=DATASET_ERROR_MSG)
+
+
+@lru_cache(maxsize=1)
+def _rendered_ok_page() -> Tuple[bytes, bytes, str]:
+    """
+    The dataset is fixed per process, so the page is too: render it once.
+    """
+    return _cached_body(_render_page(error=None).encode("utf-8"))
+
+
+def _cached_body_response(cached: Tuple[bytes, bytes, str], mimetype: str) -> Response:
+    body, gz_body, etag = cached
+    # q-value, not membership: "gzip;q=0" lists gzip but refuses it
+    use_gzip = request.accept_encodings["gzip"] > 0
+    resp = Response(gz_body if use_gzip else body, mimetype=mimetype)
+    if use_gzip:
+        resp.headers["Content-Encoding"] = "gzip"
+    resp.vary.add("Accept-Encoding")
+    # each encoding is a different representation: it needs its own etag
+    resp.set_etag(etag + "-gz" if use_gzip else etag)
+    # 304 Not Modified when the client's If-None-Match matches
+    return resp.make_conditional(request)
+
+
 @app.get("/")
-def index() -> str:
+def index() -> Response:
     try:
         # Ensure dataset is loadable; errors handled cleanly
-        _ = load_dataset()
-        return _render_page(error=None)
+        return _cached_body_response(_rendered_ok_page(), "text/html")
     except Exception:
         # Avoid stack traces in UI
-        msg = (
-            "Datenset konnte nicht geladen werden. "
-            "Prüfe, ob 'out_pawpatrol_characters/characters.json' im Service vorhanden ist "
-            "oder setze DATA_JSON_PATH/DATA_BASE_DIR korrekt."
-        )
-        return _render_page(error=msg)
+        return Response(ERROR_PAGE_HTML, mimetype="text/html")
+
+
+def _api_character_payload(ch: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": ch["id"],
+        "name": ch["name"],
+        "image_url": ch["image_url"],
+        "profile_flat": ch.get("profile_flat") or {},
+        "source_page_url": ch.get("source_page_url"),
+        "source_attribution": ch.get("source_attribution"),
+    }
+
+
+@lru_cache(maxsize=1)
+def _api_bodies() -> Tuple[Tuple[bytes, bytes, str], Dict[str, Tuple[bytes, bytes, str]]]:
+    """
+    API responses are constant per process: serialize (and compress) them once.
+    Returns (list body, {cid: single character body}), each as _cached_body.
+    """
+    ds = load_dataset()
+    out = [_api_character_payload(ch) for ch in ds["characters"]]
+    list_body = _cached_body(_json_bytes({"ok": True, "count": len(out), "characters": out}))
+    by_id = {c["id"]: _cached_body(_json_bytes({"ok": True, "character": c})) for c in out}
+    return list_body, by_id
+
+
+def _api_response(cached: Tuple[bytes, bytes, str]) -> Response:
+    resp = _cached_body_response(cached, "application/json")
+    resp.headers["Cache-Control"] = f"public, max-age={API_MAX_AGE_SECONDS}, immutable"
+    return resp
 
 
 @app.get("/api/characters")
 def api_characters():
     try:
-        ds = load_dataset()
-        out = []
-        for ch in ds["characters"]:
-            out.append(
-                {
-                    "id": ch["id"],
-                    "name": ch["name"],
-                    "image_url": _media_url_for_local_path(ch.get("image_local_path")),
-                    "profile_flat": ch.get("profile_flat") or {},
-                    "source_page_url": ch.get("source_page_url"),
-                    "source_attribution": ch.get("source_attribution"),
-                }
-            )
-        return jsonify({"ok": True, "count": len(out), "characters": out})
+        list_body, _ = _api_bodies()
+        return _api_response(list_body)
     except Exception:
-        return jsonify({"ok": False, "error": "dataset not available"}), 500
+        return _json_response({"ok": False, "error": "dataset not available"}, 500)
 
 
 @app.get("/api/characters/<cid>")
 def api_character(cid: str):
-    if not ID_RE.match(cid or ""):
-        return jsonify({"ok": False, "error": "invalid id"}), 400
     try:
-        ds = load_dataset()
-        ch = ds["by_id"].get(cid)
-        if not ch:
-            return jsonify({"ok": False, "error": "not found"}), 404
-        out = {
-            "id": ch["id"],
-            "name": ch["name"],
-            "image_url": _media_url_for_local_path(ch.get("image_local_path")),
-            "profile_flat": ch.get("profile_flat") or {},
-            "source_page_url": ch.get("source_page_url"),
-            "source_attribution": ch.get("source_attribution"),
-        }
-        return jsonify({"ok": True, "character": out})
+        _, by_id = _api_bodies()
     except Exception:
-        return jsonify({"ok": False, "error": "dataset not available"}), 500
+        return _json_response({"ok": False, "error": "dataset not available"}, 500)
+    # ids in the dataset were validated at load: only a miss needs the regex (400 vs 404).
+    # A plain str-keyed dict: with ~400 ids a linear scan loses, and bytes keys would
+    # cost an encode per request for no hashing gain.
+    body = by_id.get(cid)
+    if body is None:
+        if not ID_RE.match(cid or ""):
+            return _json_response({"ok": False, "error": "invalid id"}, 400)
+        return _json_response({"ok": False, "error": "not found"}, 404)
+    return _api_response(body)
 
 
 @app.get("/media/<path:relpath>")
 def media(relpath: str):
-    # Only allow images/* under DATA_BASE_DIR
-    relpath = (relpath or "").lstrip("/")
-    if not relpath.startswith(MEDIA_ALLOWED_PREFIX):
-        return jsonify({"ok": False, "error": "not found"}), 404
-
-    safe_abs = _safe_realpath(DATA_BASE_DIR, relpath)
-    if not safe_abs or not os.path.exists(safe_abs) or not os.path.isfile(safe_abs):
+    # Only images referenced by the dataset: their paths were validated (images/* inside
+    # DATA_BASE_DIR, no traversal) and checked for existence at load, so this is one lookup.
+    try:
+        safe_abs = load_dataset()["media_index"].get((relpath or "").lstrip("/"))
+    except Exception:
+        safe_abs = None
+    if not safe_abs:
         return jsonify({"ok": False, "error": "not found"}), 404
 
-    resp: Response = send_file(safe_abs)
+    # conditional: ETag/Last-Modified -> 304
+    resp: Response = send_file(safe_abs, conditional=True, max_age=MEDIA_MAX_AGE_SECONDS)
     resp.headers["Cache-Control"] = f"public, max-age={MEDIA_MAX_AGE_SECONDS}, immutable"
     return resp
 
 
+# Warm-up at import (gunicorn worker boot, not the first visitor): dataset, views, page, API
+try:
+    _rendered_ok_page()
+    _api_bodies()
+except Exception:
+    pass  # index() renders the error page on request
+
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "8080"))
     app.run(host="0.0.0.0", port=port, debug=False)
@@ -6,12 +6,44 @@ translate_dataset.py mit manuellem Term-Mapper
 """
 
 
+import asyncio
 import datetime as dt
 import json
 import os
+import random
 import re
 import time
-from typing import Any, Dict, List, Optional
+import types
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+try:
+    # optional: Streaming-Parser, dann liegt nie der ganze Datensatz im Speicher
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # optional: C-JSON-Codec für Cache und Ausgabe (gleiches Format wie json mit indent=2)
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # kommt mit google-cloud-translate; nur für die Retry-Entscheidung
+    from google.api_core import exceptions as gapi_exceptions
+except ImportError:
+    gapi_exceptions = None
+
+# Falsche Credentials/Rechte brechen ab. Wiederholt werden nur vorübergehende Fehler
+# (Quota, 5xx, Timeouts, Verbindungsabbrüche); alles andere fällt sofort auf das Original zurück.
+FATAL_API_ERRORS = (gapi_exceptions.PermissionDenied, gapi_exceptions.Unauthenticated) if gapi_exceptions else ()
+RETRYABLE_API_ERRORS = (
+    gapi_exceptions.ResourceExhausted, gapi_exceptions.ServiceUnavailable,
+    gapi_exceptions.DeadlineExceeded, gapi_exceptions.InternalServerError, gapi_exceptions.RetryError,
+) if gapi_exceptions else ()
+RETRYABLE_API_ERRORS += (ConnectionError, asyncio.TimeoutError)
 
 # ============================================================
 # 0) HEADER – HIER ALLES EINSTELLEN
@@ -30,10 +62,16 @@ CREDENTIALS_JSON_PATH = os.path.join(APP_DIR, "..", "data-tales-481512-4af38e5c8
 LABELS_ONLY = False
 CACHE_PATH = OUT_JSON_PATH + ".translate_cache_de.json"
 
+# Eingabedateien darüber werden mit ijson gestreamt (falls installiert), kleinere einmal geparst
+JSON_STREAM_MIN_BYTES = 500_000_000
+
 BATCH_MAX_CHARS = 8000
 BATCH_MAX_ITEMS = 50
 MAX_RETRIES = 5
 BASE_BACKOFF_S = 0.8
+MAX_CONCURRENT = 8  # gleichzeitige translate_text-Requests (Projekt-Quota beachten)
+CACHE_SAVE_INTERVAL_S = 2.0  # Cache spätestens so oft während der Übersetzung sichern
+MAX_CACHE = 200_000  # Einträge; darüber fliegen die am längsten nicht genutzten raus
 
 # ============================================================
 # 1) Manueller Mapper & Label Mapping
@@ -41,10 +79,9 @@ BASE_BACKOFF_S = 0.8
 
 # NEU: Begriffe, die hart ersetzt werden, bevor die API gefragt wird.
 # Funktioniert für ganze Strings oder Teile davon.
-MANUAL_TERM_MAPPER = MANUAL_TERM_MAPPER = {
+MANUAL_TERM_MAPPER: Mapping[str, str] = types.MappingProxyType({
     # --- Charaktere (Menschen & Tiere) ---
     "Mayor Goodway": "Bürgermeisterin Gutherz",
-    "Mayor Humdinger": "Bürgermeister Besserwisser",
     "Chickaletta": "Henrietta",
     "Captain Turbot": "Käpt'n Tollpatsch",
 
@@ -53,17 +90,12 @@ MANUAL_TERM_MAPPER = MANUAL_TERM_MAPPER = {
     "Alex Porter": "Alex Pfeffer",
     "Farmer Yumi": "Bäuerin Yumi",
     "Farmer Al": "Bauer Al",
-    "Sid Swashbuckle": "Sid der Säbelrassler",
-    "The Copycat": "Der Nachahmer",
     "Harold Humdinger": "Harold Besserwisser",
     "Princess of Barkingburg": "Prinzessin von Barkingburg",
-    "The Duke of Flappington": "Der Herzog von Flappington",
     "Santa Claus": "Weihnachtsmann",
     "Tilly Turbot": "Tilly Tollpatsch",
     "Cap'n Turbot": "Käpt'n Tollpatsch",
-    "Captain Turbot": "Käpt'n Tollpatsch",
     "Horatio Turbot": "Horatio Tollpatsch",
-    "Francois Turbot": "Francois Tollpatsch",
     "Dr. Turbot": "Dr. Tollpatsch",
     "Tammy Turbot": "Tammy Tollpatsch",
     "Taylor Turbot": "Taylor Tollpatsch",
@@ -117,8 +149,6 @@ MANUAL_TERM_MAPPER = MANUAL_TERM_MAPPER = {
     "pup": "Welpe",
     "pups": "Welpen",
     "Pup Pad": "Welpen-Pad",
-    "Air Patroller": "Air Patrouiller",
-    "Sea Patroller": "Meeres-Patrouiller",
     "Mighty Pups": "Mighty Pups",
     "Ultimate Rescue": "Ultimativer Einsatz",
     "Mission PAW": "Mission Pfote",
@@ -144,7 +174,7 @@ MANUAL_TERM_MAPPER = MANUAL_TERM_MAPPER = {
     # Oft wird die Kamerafrau im Englischen auch einfach nur 
     # deskriptiv genannt, falls sie keinen Namen hat:
     "The camerawoman": "Die Kamerafrau",
-}
+})
 
 LABEL_DE = {
     "Species": "Spezies",
@@ -166,75 +196,185 @@ LABEL_DE = {
 
 WS_RE = re.compile(r"\s+")
 CONTROL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+LETTERS_RE = re.compile(r"[A-Za-z]{2,}")  # mindestens ein Wort ("No", "5 or 6"), keine reinen Zahlen
+GERMAN_CHARS_RE = re.compile(r"[äöüßÄÖÜ]")
+URL_RE = re.compile(r"(?:https?://|www\.)\S*$")
+# trifft genau die Strings, an denen clean_text etwas ändern würde
+NEEDS_CLEAN_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]|[^\S ]|\s\s|^\s|\s$")
+
+# Alle Begriffe in einer Alternation, längste zuerst: ein Regex-Durchlauf statt einer
+# Suche pro Begriff, und "pups"/"The camerawoman" gewinnen gegen "pup"/"camerawoman".
+MANUAL_TERM_RE = re.compile("|".join(re.escape(k) for k in sorted(MANUAL_TERM_MAPPER, key=len, reverse=True)))
+MANUAL_TERM_VALUES = frozenset(MANUAL_TERM_MAPPER.values())
 
 def apply_manual_mapping(text: str) -> str:
     """Ersetzt Begriffe basierend auf MANUAL_TERM_MAPPER."""
     if not text:
         return text
-    for eng, deu in MANUAL_TERM_MAPPER.items():
-        # Nutzt Regex für Wortgrenzen-Sicherheit oder einfaches replace
-        # Hier einfaches Case-Sensitive Replace für Teilstrings:
-        if eng in text:
-            text = text.replace(eng, deu)
-    return text
+    # Case-Sensitive Replace für Teilstrings (keine Wortgrenzen)
+    return MANUAL_TERM_RE.sub(lambda m: MANUAL_TERM_MAPPER[m.group(0)], text)
 
 def utc_now_iso() -> str:
     return dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
+@lru_cache(maxsize=8192)
+def _clean_str(s: str) -> str:
+    s = CONTROL_RE.sub(" ", s)
+    return WS_RE.sub(" ", s).strip()
+
 def clean_text(s: Any) -> str:
+    # läuft pro Text mehrfach (Sammeln, translate_many, tr, map_label): saubere Strings
+    # kommen ohne Ersetzung zurück, der Rest über den Cache
     if s is None: return ""
-    s = str(s)
-    s = CONTROL_RE.sub(" ", s)
-    s = WS_RE.sub(" ", s).strip()
-    return s
+    if not isinstance(s, str): s = str(s)
+    if not NEEDS_CLEAN_RE.search(s): return s
+    return _clean_str(s)
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        obj = json.load(f)
-    return obj
+    # ein read() der Bytes statt json.load über den Text-Decoder
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def iter_characters(path: str) -> Iterator[Any]:
+    """Charaktere einzeln aus der Datei, ohne die ganze Liste zu laden (braucht ijson)."""
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "characters.item", use_float=True)
+
+def load_meta(path: str) -> Dict[str, Any]:
+    """Nur der "meta"-Block (steht vorne in der Datei, ijson hört danach auf; braucht ijson)."""
+    with open(path, "rb") as f:
+        return next(ijson.items(f, "meta", use_float=True), None) or {}
+
+def _dumps(obj: Any) -> bytes:
+    # wie json.dumps(indent=2, ensure_ascii=False), als UTF-8
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _dumps_indented(obj: Any, level: int) -> bytes:
+    # eingerückt für diese Verschachtelungstiefe (Strings enthalten nie ein rohes \n)
+    return _dumps(obj).replace(b"\n", b"\n" + b"  " * level)
 
 def save_json(path: str, obj: Dict[str, Any]) -> None:
+    """
+    Gleiche Ausgabe wie json.dump(obj, indent=2), aber "characters" wird Eintrag für
+    Eintrag geschrieben (darf auch ein Generator sein): nie der ganze JSON-String im Speicher.
+    """
     os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
-
-def load_cache(path: str) -> Dict[str, str]:
-    if not os.path.exists(path): return {}
+    tmp = path + ".tmp"
+    with open(tmp, "wb", buffering=1 << 16) as f:
+        f.write(b"{")
+        for i, (k, v) in enumerate(obj.items()):
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(_dumps(k) + b": ")
+            if k != "characters":
+                f.write(_dumps_indented(v, 1))
+                continue
+            n = 0
+            for n, ch in enumerate(v, start=1):
+                f.write(b",\n    " if n > 1 else b"[\n    ")
+                f.write(_dumps_indented(ch, 2))
+            f.write(b"\n  ]" if n else b"[]")
+        f.write(b"\n}" if obj else b"}")
+    os.replace(tmp, path)
+
+def load_cache(path: str) -> "OrderedDict[str, str]":
+    # kein exists()-Check vorab: ein open, fehlende Datei = leerer Cache.
+    # Reihenfolge in der Datei = LRU-Reihenfolge (älteste zuerst)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except: return {}
+        with open(path, "rb") as f:
+            data = f.read()
+        return OrderedDict(orjson.loads(data) if orjson is not None else json.loads(data))
+    except (OSError, ValueError): return OrderedDict()
 
 def save_cache(path: str, cache: Dict[str, str]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
+    # atomar: ein Abbruch mitten im Schreiben lässt den alten Cache stehen
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        # dict(...) übernimmt die OrderedDict-Reihenfolge (LRU); orjson liest sonst die interne
+        # Einfügereihenfolge und ignoriert move_to_end
+        f.write(_dumps(dict(cache)))
+    os.replace(tmp, path)
 
 def map_label(label: Any) -> str:
+    # nur Strings in den Cache: Listen/Dicts sind nicht hashbar, werden wie bisher per str() gemappt
+    if not isinstance(label, str): label = clean_text(label)
+    return _map_label_str(label)
+
+@lru_cache(maxsize=1024)
+def _map_label_str(label: str) -> str:
     k = clean_text(label)
     return LABEL_DE.get(k, k)
 
 def is_nonempty_str(x: Any) -> bool:
     return isinstance(x, str) and x.strip() != ""
 
+def needs_translation(s: str) -> bool:
+    """False für Zahlen, "N/A", URLs und Begriffe, die der Mapper schon festlegt (auch "Claw": "Claw")."""
+    return s not in MANUAL_TERM_MAPPER and bool(LETTERS_RE.search(s)) and not URL_RE.match(s)
+
+def looks_german(s: str) -> bool:
+    """Heuristik: Umlaute/ß oder genau ein Mapper-Ergebnis ("Welpen-Pad") -> schon Deutsch."""
+    return s in MANUAL_TERM_VALUES or bool(GERMAN_CHARS_RE.search(s))
+
 def ensure_credentials_env() -> None:
     if LABELS_ONLY: return
     if not os.getenv("GOOGLE_APPLICATION_CREDENTIALS") and CREDENTIALS_JSON_PATH:
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = os.path.abspath(CREDENTIALS_JSON_PATH)
 
+def pack_batches(texts: List[str]) -> List[List[str]]:
+    """
+    Teilt texts in Batches mit höchstens BATCH_MAX_ITEMS Einträgen und BATCH_MAX_CHARS Zeichen.
+    Längste zuerst (first-fit-decreasing): die vielen kurzen Labels füllen am Ende volle
+    Batches, statt 50er-Slots neben einem langen Summary zu verschenken.
+    Ein einzelner Text über BATCH_MAX_CHARS bekommt einen eigenen Batch.
+    """
+    todo = sorted(texts, key=len, reverse=True)
+    batches: List[List[str]] = []
+    i = 0
+    while i < len(todo):
+        batch, total_chars = [], 0
+        while i < len(todo) and len(batch) < BATCH_MAX_ITEMS:
+            n = len(todo[i])
+            if batch and total_chars + n > BATCH_MAX_CHARS: break
+            batch.append(todo[i])
+            total_chars += n
+            i += 1
+        batches.append(batch)
+    return batches
+
 # ============================================================
 # 3) Translator Class
 # ============================================================
 
 class GCloudTranslator:
-    def __init__(self, project_id, location, target_lang, source_lang, cache):
+    def __init__(self, project_id, location, target_lang, source_lang, cache, cache_path=None):
         from google.cloud import translate_v3 as translate
-        self.client = translate.TranslationServiceClient()
+        # Async-Client: sein gRPC-Kanal hängt am Event-Loop, daher pro Lauf in _translate_batches
+        self._client_factory = translate.TranslationServiceAsyncClient
         self.parent = f"projects/{project_id}/locations/{location}"
         self.target_lang = target_lang
         self.source_lang = source_lang
-        self.cache = cache if cache is not None else {}
-
-    def _translate_request(self, contents: List[str]) -> List[str]:
+        self.cache = cache if isinstance(cache, OrderedDict) else OrderedDict(cache or {})
+        self.cache_path = cache_path
+        self._last_save = time.monotonic()
+
+    def _checkpoint_due(self) -> bool:
+        # bezahlte API-Ergebnisse nicht erst am Ende sichern, aber höchstens alle CACHE_SAVE_INTERVAL_S
+        if not self.cache_path: return False
+        now = time.monotonic()
+        if now - self._last_save < CACHE_SAVE_INTERVAL_S: return False
+        self._last_save = now
+        return True
+
+    async def _save_snapshot(self, lock: asyncio.Lock, snapshot: "OrderedDict[str, str]") -> None:
+        # Datei-I/O im Thread: der Event-Loop und die offenen Batches laufen weiter.
+        # Das Lock schreibt die Sicherungen nacheinander, in Auftragsreihenfolge (neueste zuletzt).
+        async with lock:
+            await asyncio.to_thread(save_cache, self.cache_path, snapshot)
+
+    async def _translate_request(self, client, sem: asyncio.Semaphore, contents: List[str]) -> List[str]:
         req = {
             "parent": self.parent,
             "contents": contents,
@@ -244,14 +384,52 @@ class GCloudTranslator:
         }
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                resp = self.client.translate_text(request=req)
+                # nur der Request belegt einen Slot, das Backoff-Warten nicht
+                async with sem:
+                    resp = await client.translate_text(request=req)
                 return [tr.translated_text for tr in resp.translations]
-            except Exception as e:
-                time.sleep(min(10.0, BASE_BACKOFF_S * (2 ** (attempt - 1))))
+            except FATAL_API_ERRORS:
+                raise
+            except RETRYABLE_API_ERRORS:
+                if attempt == MAX_RETRIES: break
+                # Jitter, damit parallele Batches nach einem 429 nicht im Gleichschritt wiederkommen;
+                # asyncio.sleep blockiert die anderen Batches nicht
+                await asyncio.sleep(min(10.0, BASE_BACKOFF_S * (2 ** (attempt - 1))) * (0.5 + random.random()))
+            except Exception:
+                break
         return contents # Fallback auf Original bei totalem Failure
 
+    async def _translate_batches(self, batches: List[List[str]]) -> None:
+        # alle Batches gleichzeitig, höchstens MAX_CONCURRENT Requests offen; Ergebnisse in
+        # Batch-Reihenfolge übernehmen, dann bleibt der Cache stabil sortiert
+        sem = asyncio.Semaphore(MAX_CONCURRENT)
+        lock = asyncio.Lock()
+        saves: List["asyncio.Future[None]"] = []
+        async with self._client_factory() as client:
+            tasks = [asyncio.ensure_future(self._translate_request(client, sem, b)) for b in batches]
+            try:
+                for batch, task in zip(batches, tasks):
+                    translated = await task
+                    for src, dst in zip(batch, translated):
+                        # Auch auf das Ergebnis der API nochmal den manuellen Mapper loslassen
+                        self.cache[src] = apply_manual_mapping(clean_text(dst))
+                    if self._checkpoint_due():
+                        # Momentaufnahme jetzt (der Cache wächst weiter), geschrieben im Hintergrund
+                        saves.append(asyncio.ensure_future(self._save_snapshot(lock, OrderedDict(self.cache))))
+            except BaseException:
+                # fataler Fehler (z.B. Credentials) oder Ctrl-C: restliche Batches abbrechen,
+                # das bisher Übersetzte noch sichern
+                for task in tasks: task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if self.cache_path:
+                    saves.append(asyncio.ensure_future(self._save_snapshot(lock, OrderedDict(self.cache))))
+                raise
+            finally:
+                await asyncio.gather(*saves, return_exceptions=True)
+
     def translate_many(self, texts: List[str]) -> Dict[str, str]:
-        uniq = list(dict.fromkeys([clean_text(t) for t in texts if clean_text(t)]))
+        # bereinigen und deduplizieren in einem Durchlauf (clean_text nur einmal pro Text)
+        uniq = [t for t in dict.fromkeys(map(clean_text, texts)) if t]
         
         # NEU: Erst manuelles Mapping prüfen
         for t in uniq:
@@ -260,94 +438,188 @@ class GCloudTranslator:
                 if mapped != t:
                     self.cache[t] = mapped
 
-        todo = [t for t in uniq if t not in self.cache]
-        if todo:
-            for i in range(0, len(todo), BATCH_MAX_ITEMS):
-                batch = todo[i : i + BATCH_MAX_ITEMS]
-                translated = self._translate_request(batch)
-                for src, dst in zip(batch, translated):
-                    # Auch auf das Ergebnis der API nochmal den manuellen Mapper loslassen
-                    self.cache[src] = apply_manual_mapping(clean_text(dst))
-
-        return {t: self.cache[t] for t in uniq if t in self.cache}
+        todo = [t for t in uniq if t not in self.cache and needs_translation(t)]
+        if self.target_lang == "de":
+            # schon deutsche Texte nicht schicken; bewusst ohne Cache-Eintrag, tr() nimmt
+            # dann das Original (mit manuellem Mapping)
+            todo = [t for t in todo if not looks_german(t)]
+        batches = pack_batches(todo)
+        if batches:
+            asyncio.run(self._translate_batches(batches))
+
+        out = {t: self.cache[t] for t in uniq if t in self.cache}
+        # LRU: alles, was dieser Lauf braucht, ans Ende; erst danach kürzen, damit nichts
+        # Bezahltes aus diesem Lauf verloren geht
+        for t in out:
+            self.cache.move_to_end(t)
+        while len(self.cache) > MAX_CACHE:
+            self.cache.popitem(last=False)
+        # die eine Endsicherung des Laufs (nach LRU-Pflege; main speichert nicht noch einmal)
+        if self.cache_path:
+            save_cache(self.cache_path, self.cache)
+            self._last_save = time.monotonic()
+        return out
 
 # ============================================================
 # 4) Transform Logic
 # ============================================================
 
+Slot = Tuple[Dict[str, Any], str]
+
+def _item_slots(items: Iterable[Dict[str, Any]], slots: List[Slot]) -> List[Dict[str, Any]]:
+    # Namen einmal lokal binden statt pro Eintrag global nachzuschlagen
+    _map_label, add = map_label, slots.append
+    out = []
+    for it in items:
+        it = dict(it)
+        it["label"] = _map_label(it.get("label"))
+        it["value"] = it.get("value")
+        add((it, "value"))
+        out.append(it)
+    return out
+
+def copy_with_slots(ch: Any, slots: List[Slot]) -> Any:
+    """
+    Kopiert einen Charakter so weit, wie die Übersetzung ihn verändert (Labels schon
+    gemappt) und hängt für jeden zu übersetzenden Wert (Container, Schlüssel) an slots an.
+    Einzige Stelle, die weiß, welche Felder übersetzt werden: Sammeln und Zurückschreiben
+    laufen beide darüber. Kein Deep-Copy: alles andere (image, source, ...) wird mit dem
+    Eingabe-Charakter geteilt.
+    """
+    if not isinstance(ch, dict):
+        return ch
+    ch = dict(ch)
+    _ins, add = is_nonempty_str, slots.append
+
+    # --- NEU: Hier werden jetzt auch die Namen übersetzt ---
+    if _ins(ch.get("name")):
+        add((ch, "name"))
+
+    if _ins(ch.get("link_text_from_list")):
+        add((ch, "link_text_from_list"))
+    # -------------------------------------------------------
+
+    if _ins(ch.get("summary")):
+        add((ch, "summary"))
+
+    if isinstance(ch.get("profile_flat"), dict):
+        _map_label = map_label
+        flat = {}
+        for k, v in ch["profile_flat"].items():
+            k = _map_label(k)
+            # zwei Labels mit gleichem Mapping: der letzte Wert gewinnt, ein Slot reicht
+            if k not in flat: add((flat, k))
+            flat[k] = v
+        ch["profile_flat"] = flat
+
+    if "profile" in ch:
+        ch["profile"] = _item_slots(ch["profile"], slots)
+
+    if "profile_groups" in ch:
+        groups = []
+        for g in ch["profile_groups"]:
+            g = dict(g)
+            g["group"] = g.get("group")
+            add((g, "group"))
+            if "fields" in g:
+                g["fields"] = _item_slots(g["fields"], slots)
+            groups.append(g)
+        ch["profile_groups"] = groups
+    return ch
+
+def slot_texts(slots: Iterable[Slot]) -> List[str]:
+    return [v for v in (parent[key] for parent, key in slots) if is_nonempty_str(v)]
+
+def fill_slots(slots: Iterable[Slot], tr: Callable[[Any], Any]) -> None:
+    for parent, key in slots:
+        parent[key] = tr(parent[key])
+
 def collect_texts_for_translation(dataset: Dict[str, Any]) -> List[str]:
-    texts = []
-    for ch in dataset.get("characters", []):
-        if not isinstance(ch, dict): continue
-        # NEU: Namen zur Übersetzungsliste hinzufügen
-        if is_nonempty_str(ch.get("name")): texts.append(ch["name"])
-        if is_nonempty_str(ch.get("link_text_from_list")): texts.append(ch["link_text_from_list"])
-        
-        if is_nonempty_str(ch.get("summary")): texts.append(ch["summary"])
-        for v in ch.get("profile_flat", {}).values():
-            if is_nonempty_str(v): texts.append(v)
-        for it in ch.get("profile", []):
-            if is_nonempty_str(it.get("value")): texts.append(it["value"])
-        for g in ch.get("profile_groups", []):
-            for it in g.get("fields", []):
-                if is_nonempty_str(it.get("value")): texts.append(it["value"])
-    return texts
+    return collect_texts_from_characters(dataset.get("characters", []))
 
-def transform_dataset(src: Dict[str, Any], translator: Optional[GCloudTranslator], translate_texts: bool) -> Dict[str, Any]:
-    out = json.loads(json.dumps(src))
-    
-    lookup = {}
-    if translate_texts and translator:
-        all_texts = collect_texts_for_translation(out)
-        lookup = translator.translate_many(all_texts)
+def collect_texts_from_characters(characters: Iterable[Any]) -> List[str]:
+    slots: List[Slot] = []
+    for ch in characters:
+        copy_with_slots(ch, slots)
+    return slot_texts(slots)
 
+def make_translate_fn(lookup: Dict[str, str], translate_texts: bool) -> Callable[[Any], Any]:
+    # läuft einmal pro Slot: Funktionen vorab lokal binden
+    _clean, _map, get = clean_text, apply_manual_mapping, lookup.get
     def tr(val: Any) -> Any:
-        s = clean_text(val)
+        # lookup-Schlüssel sind bereits bereinigt: steht val selbst drin, war es schon sauber
+        # und clean_text kann entfallen (ein schmutziger String ist nie ein Schlüssel)
+        if lookup and type(val) is str:
+            hit = get(val)
+            if hit is not None: return hit
+        s = _clean(val)
         if not s: return val
         if not translate_texts:
-            return apply_manual_mapping(s)
-        return lookup.get(s, apply_manual_mapping(s))
+            return _map(s)
+        # Mapping nur bei einem Fehltreffer (als Default von get lief es bei jedem Treffer mit)
+        hit = get(s)
+        return hit if hit is not None else _map(s)
+    return tr
+
+def transform_character(ch: Any, tr: Callable[[Any], Any]) -> Any:
+    slots: List[Slot] = []
+    ch = copy_with_slots(ch, slots)
+    fill_slots(slots, tr)
+    return ch
 
-    for ch in out.get("characters", []):
-        # --- NEU: Hier werden jetzt auch die Namen übersetzt ---
-        if is_nonempty_str(ch.get("name")):
-            ch["name"] = tr(ch["name"])
-        
-        if is_nonempty_str(ch.get("link_text_from_list")):
-            ch["link_text_from_list"] = tr(ch["link_text_from_list"])
-        # -------------------------------------------------------
-
-        if is_nonempty_str(ch.get("summary")): 
-            ch["summary"] = tr(ch["summary"])
-        
-        if isinstance(ch.get("profile_flat"), dict):
-            ch["profile_flat"] = {map_label(k): tr(v) for k, v in ch["profile_flat"].items()}
+def transform_dataset(src: Dict[str, Any], translator: Optional[GCloudTranslator], translate_texts: bool) -> Dict[str, Any]:
+    """
+    Variante für einen bereits geladenen Datensatz (src bleibt unverändert).
+    Ein Durchlauf über die Charaktere: kopieren und Slots merken, dann alles auf einmal
+    übersetzen und flach in die Slots zurückschreiben.
+    """
+    out = dict(src)
+    slots: List[Slot] = []
+    if "characters" in src:
+        out["characters"] = [copy_with_slots(ch, slots) for ch in src["characters"]]
 
-        for it in ch.get("profile", []):
-            it["label"] = map_label(it.get("label"))
-            it["value"] = tr(it.get("value"))
+    lookup = {}
+    if translate_texts and translator:
+        lookup = translator.translate_many(slot_texts(slots))
+    fill_slots(slots, make_translate_fn(lookup, translate_texts))
+    return out
 
-        for g in ch.get("profile_groups", []):
-            g["group"] = tr(g.get("group"))
-            for it in g.get("fields", []):
-                it["label"] = map_label(it.get("label"))
-                it["value"] = tr(it.get("value"))
+def transform_file(path: str, translator: Optional[GCloudTranslator], translate_texts: bool) -> Dict[str, Any]:
+    """
+    Übersetzt die Datei unter path.
+    Normalfall (wenige MB, oder ohne ijson): einmal parsen, dann transform_dataset mit nur
+    einem Durchlauf über die Charaktere; alle anderen Schlüssel bleiben wie im Original.
+    Erst über JSON_STREAM_MIN_BYTES wird gestreamt, übernommen werden dann nur "meta" und
+    "characters" (mehr schreibt download_data.py nicht): 1. Durchlauf sammelt die Texte,
+    2. Durchlauf übersetzt Charakter für Charakter. Zwei Durchläufe, weil ein Text aus dem
+    ersten Charakter erst nach dem einen translate_many über alle Texte feststeht; in einem
+    Durchlauf müssten bis dahin alle Charaktere im Speicher liegen, und genau das soll das
+    Streaming vermeiden. "characters" ist dann ein Generator: save_json schreibt jeden
+    Charakter, sobald er übersetzt ist.
+    """
+    if ijson is None or os.path.getsize(path) <= JSON_STREAM_MIN_BYTES:
+        return transform_dataset(load_json(path), translator, translate_texts)
 
-    return out
+    lookup = {}
+    if translate_texts and translator:
+        lookup = translator.translate_many(collect_texts_from_characters(iter_characters(path)))
+    tr = make_translate_fn(lookup, translate_texts)
+    return {
+        "meta": load_meta(path),
+        "characters": (transform_character(ch, tr) for ch in iter_characters(path)),
+    }
 
 def main():
     if not os.path.exists(IN_JSON_PATH): return 1
-    src = load_json(IN_JSON_PATH)
     ensure_credentials_env()
     cache = load_cache(CACHE_PATH)
 
     translator = None
     if not LABELS_ONLY:
-        translator = GCloudTranslator(GCP_PROJECT_ID, GCP_LOCATION, TARGET_LANG, SOURCE_LANG, cache)
+        translator = GCloudTranslator(GCP_PROJECT_ID, GCP_LOCATION, TARGET_LANG, SOURCE_LANG, cache, CACHE_PATH)
 
-    out = transform_dataset(src, translator, not LABELS_ONLY)
+    out = transform_file(IN_JSON_PATH, translator, not LABELS_ONLY)
     save_json(OUT_JSON_PATH, out)
-    if translator: save_cache(CACHE_PATH, translator.cache)
     print(f"Fertig! Datei gespeichert unter: {OUT_JSON_PATH}")
     return 0
 